@@ -1,46 +1,154 @@
 """API routes - FastAPI endpoints."""
 
 import logging
+from bisect import bisect_right
+from dataclasses import dataclass, field, replace
+from operator import attrgetter
 from pathlib import Path
+from typing import Optional
 from fastapi import APIRouter, Request, UploadFile, File, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+import numpy as np
 
 from ..config import get_settings
 from ..services import parse_csv_file, rank_stocks, calculate_analytics, get_market_overview
+from ..models import RankedColumns
+from ..services.analytics import Analytics
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 templates_dir = Path(__file__).parent.parent / "templates"
-templates = Jinja2Templates(directory=str(templates_dir))
 
-# In-memory storage for current session
-_current_stocks: list = []
-_current_stock_data: list = []  # Raw StockData for market overview
-_current_analytics = None
-_current_market_data: list = []
+
+def _create_template_env() -> Environment:
+    """Create the Jinja environment; outside debug mode templates are treated as static."""
+    options = {"loader": FileSystemLoader(str(templates_dir)), "autoescape": True}
+    if not get_settings().debug:
+        # Skip per-render mtime checks, never evict compiled templates, and
+        # reuse compiled bytecode across restarts (per-user temp directory)
+        options.update(auto_reload=False, cache_size=-1, bytecode_cache=FileSystemBytecodeCache())
+    return Environment(**options)
+
+
+templates = Jinja2Templates(env=_create_template_env())
+
+# Sort keys for the stock table, by sort_by query value
+_SORT_KEYS = {
+    "rank": attrgetter("rank"),
+    "symbol": attrgetter("data.symbol_lc"),
+    "price": attrgetter("data.price"),
+    "market_cap": attrgetter("data.market_cap"),
+    "score": attrgetter("total_score"),
+    "confidence": attrgetter("confidence"),
+    "price_mom": attrgetter("components.price_momentum"),
+    "vol_mom": attrgetter("components.volume_momentum"),
+    "industry": attrgetter("data.industry_lc"),
+    "perf_1d": attrgetter("data.change_1d"),
+    "perf_1w": attrgetter("data.perf_1w"),
+    "perf_1m": attrgetter("data.perf_1m"),
+    "perf_3m": attrgetter("data.perf_3m"),
+    "perf_6m": attrgetter("data.perf_6m"),
+    "perf_ytd": attrgetter("data.perf_ytd"),
+    "perf_1y": attrgetter("data.perf_1y"),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Snapshot:
+    """Everything derived from one upload - replaced as a whole, never edited in place.
+    
+    Only the sorted_views memo fills in after publication.
+    """
+    stocks: list  # Ranked stocks in rank order
+    stock_data: list  # Raw StockData for market overview
+    analytics: Optional[Analytics]
+    market_data: list
+    by_industry: dict[str, list[int]]  # Rank positions of the stocks in each industry
+    by_sector: dict[str, list[int]]  # Rank positions of the stocks in each sector
+    # Memoized full-universe orderings keyed by (sort_by, reverse), filled on demand
+    sorted_views: dict[tuple[str, bool], list] = field(default_factory=dict)
+    
+    def sorted_view(self, sort_by: str, reverse: bool) -> list:
+        """Get all stocks sorted by a key, sorting only on first use."""
+        view = self.sorted_views.get((sort_by, reverse))
+        if view is None:
+            view = sorted(self.stocks, key=_SORT_KEYS[sort_by], reverse=reverse)
+            self.sorted_views[(sort_by, reverse)] = view
+        return view
+
+
+# In-memory state for the current session. Requests read it once into a local;
+# uploads publish a new Snapshot with a single assignment.
+_snapshot = Snapshot(stocks=[], stock_data=[], analytics=None, market_data=[], by_industry={}, by_sector={})
+
+
+def _group_positions(labels: np.ndarray) -> dict[str, list[int]]:
+    """Map each label to the ascending positions holding it."""
+    names, inverse = np.unique(labels, return_inverse=True)
+    order = np.argsort(inverse, kind="stable")
+    groups = np.split(order, np.cumsum(np.bincount(inverse))[:-1])
+    return {name: group.tolist() for name, group in zip(names.tolist(), groups)}
+
+
+def _index_stocks(columns: RankedColumns) -> tuple[dict[str, list[int]], dict[str, list[int]]]:
+    """Group rank positions by industry and by sector, preserving rank order."""
+    return _group_positions(columns.industry), _group_positions(columns.sector)
+
+
+def _build_snapshot(content: bytes) -> Snapshot:
+    """Parse, rank and analyze an uploaded CSV into a new Snapshot."""
+    logger.info("Parsing CSV data...")
+    stock_data = parse_csv_file(content)
+    logger.info("Parsed %d stocks from CSV", len(stock_data))
+    
+    logger.info("Calculating momentum scores...")
+    stocks = rank_stocks(stock_data)
+    by_industry, by_sector = _index_stocks(stocks.columns)
+    logger.info("Ranked %d stocks", len(stocks))
+    
+    logger.info("Calculating analytics...")
+    analytics = calculate_analytics(stocks)
+    logger.info("Analytics complete - Top 20 avg score: %.1f", analytics.top_20_avg_score)
+    
+    # Get market overview data
+    logger.info("Getting market overview...")
+    market_data = get_market_overview(stock_data)
+    logger.info("Found %d market ETFs", len(market_data))
+    
+    return Snapshot(
+        stocks=stocks,
+        stock_data=stock_data,
+        analytics=analytics,
+        market_data=market_data,
+        by_industry=by_industry,
+        by_sector=by_sector,
+    )
 
 
 @router.get("/", response_class=HTMLResponse)
 async def home(request: Request):
     """Render home page."""
-    global _current_market_data
+    global _snapshot
     logger.info("Rendering home page")
     settings = get_settings()
     
-    # Always fetch fresh market data on home page load
+    # Fetch market data on every home page load (reused within the cache window)
     logger.info("Fetching market overview...")
-    _current_market_data = get_market_overview()
-    logger.info(f"Fetched {len(_current_market_data)} market ETFs")
+    market_data = get_market_overview()
+    logger.info("Fetched %d market ETFs", len(market_data))
+    _snapshot = snap = replace(_snapshot, market_data=market_data)
     
     return templates.TemplateResponse("index.html", {
         "request": request,
         "settings": settings,
-        "stocks": _current_stocks,
-        "analytics": _current_analytics,
-        "market_data": _current_market_data,
+        "stocks": snap.stocks,
+        "analytics": snap.analytics,
+        "market_data": snap.market_data,
         "sort_by": "rank",
         "sort_dir": "asc",
     })
@@ -49,56 +157,39 @@ async def home(request: Request):
 @router.post("/upload", response_class=HTMLResponse)
 async def upload_csv(request: Request, file: UploadFile = File(...)):
     """Handle CSV file upload and process stocks."""
-    global _current_stocks, _current_analytics
+    global _snapshot
     settings = get_settings()
     
-    logger.info(f"Received file upload: {file.filename}")
+    logger.info("Received file upload: %s", file.filename)
     
-    # Validate file size
-    content = await file.read()
+    # Validate file size - read at most one byte past the limit
+    max_size = settings.max_file_size_mb * 1024 * 1024
+    content = await file.read(max_size + 1)
     file_size_kb = len(content) / 1024
-    logger.info(f"File size: {file_size_kb:.1f} KB")
+    logger.info("File size: %.1f KB", file_size_kb)
     
-    max_size = settings.max_file_size_mb * 1024 * 1024
     if len(content) > max_size:
-        logger.warning(f"File too large: {file_size_kb:.1f} KB > {settings.max_file_size_mb} MB")
+        logger.warning("File too large: more than %s MB", settings.max_file_size_mb)
         raise HTTPException(400, f"File too large. Max size: {settings.max_file_size_mb}MB")
     
     # Validate file type
     if not file.filename or not file.filename.endswith('.csv'):
-        logger.warning(f"Invalid file type: {file.filename}")
+        logger.warning("Invalid file type: %s", file.filename)
         raise HTTPException(400, "Only CSV files are accepted")
     
     try:
-        global _current_stock_data, _current_market_data
-        
-        # Parse and rank stocks
-        logger.info("Parsing CSV data...")
-        _current_stock_data = parse_csv_file(content)
-        logger.info(f"Parsed {len(_current_stock_data)} stocks from CSV")
-        
-        logger.info("Calculating momentum scores...")
-        _current_stocks = rank_stocks(_current_stock_data)
-        logger.info(f"Ranked {len(_current_stocks)} stocks")
-        
-        logger.info("Calculating analytics...")
-        _current_analytics = calculate_analytics(_current_stocks)
-        logger.info(f"Analytics complete - Top 20 avg score: {_current_analytics.top_20_avg_score:.1f}")
-        
-        # Get market overview data
-        logger.info("Getting market overview...")
-        _current_market_data = get_market_overview(_current_stock_data)
-        logger.info(f"Found {len(_current_market_data)} market ETFs")
-        
+        # CPU-bound work runs off the event loop; publish it in one assignment
+        snap = await run_in_threadpool(_build_snapshot, content)
+        _snapshot = snap
     except Exception as e:
-        logger.error(f"Error processing CSV: {str(e)}", exc_info=True)
+        logger.error("Error processing CSV: %s", e, exc_info=True)
         raise HTTPException(400, f"Error processing CSV: {str(e)}")
     
     return templates.TemplateResponse("partials/main_content.html", {
         "request": request,
-        "stocks": _current_stocks,
-        "analytics": _current_analytics,
-        "market_data": _current_market_data,
+        "stocks": snap.stocks,
+        "analytics": snap.analytics,
+        "market_data": snap.market_data,
         "settings": settings,
         "sort_by": "rank",
         "sort_dir": "asc",
@@ -117,51 +208,51 @@ async def get_stocks(
 ):
     """Get filtered and sorted stock table."""
     settings = get_settings()
-    filtered = _current_stocks
-    
-    logger.debug(f"Get stocks: sort_by={sort_by}, sort_dir={sort_dir}, industry={industry}, search={search}, top_n={top_n}")
-    
-    # Apply filters
-    if industry:
-        filtered = [s for s in filtered if s.data.industry == industry]
-        logger.debug(f"Filtered by industry '{industry}': {len(filtered)} stocks")
-    if sector:
-        filtered = [s for s in filtered if s.data.sector == sector]
-        logger.debug(f"Filtered by sector '{sector}': {len(filtered)} stocks")
-    if search:
-        search_lower = search.lower()
-        filtered = [s for s in filtered if search_lower in s.data.symbol.lower() or search_lower in s.data.description.lower()]
-        logger.debug(f"Filtered by search '{search}': {len(filtered)} stocks")
+    snap = _snapshot
+    
+    logger.debug("Get stocks: sort_by=%s, sort_dir=%s, industry=%s, search=%s, top_n=%d", sort_by, sort_dir, industry, search, top_n)
+    
+    # Start from the narrowest precomputed group; all of them are in rank order.
+    # snap.stocks is shared, so only lists built here may be sorted in place.
+    if industry or sector:
+        positions = snap.by_industry.get(industry, ()) if industry else snap.by_sector.get(sector, ())
+        candidates = [snap.stocks[i] for i in positions]
+    else:
+        candidates = snap.stocks
+    
+    # Rank order makes the top_n filter a prefix of the candidates
     if top_n > 0:
-        filtered = [s for s in filtered if s.rank <= top_n]
-        logger.debug(f"Filtered top {top_n}: {len(filtered)} stocks")
-    
-    # Apply sorting
-    sort_map = {
-        "rank": lambda s: s.rank,
-        "symbol": lambda s: s.data.symbol.lower(),
-        "price": lambda s: s.data.price,
-        "market_cap": lambda s: s.data.market_cap,
-        "score": lambda s: s.total_score,
-        "confidence": lambda s: s.confidence,
-        "price_mom": lambda s: s.components.price_momentum,
-        "vol_mom": lambda s: s.components.volume_momentum,
-        "industry": lambda s: s.data.industry.lower(),
-        "perf_1d": lambda s: s.data.change_1d,
-        "perf_1w": lambda s: s.data.perf_1w,
-        "perf_1m": lambda s: s.data.perf_1m,
-        "perf_3m": lambda s: s.data.perf_3m,
-        "perf_6m": lambda s: s.data.perf_6m,
-        "perf_ytd": lambda s: s.data.perf_ytd,
-        "perf_1y": lambda s: s.data.perf_1y,
-    }
-    
-    if sort_by in sort_map:
-        reverse = sort_dir == "desc"
-        filtered = sorted(filtered, key=sort_map[sort_by], reverse=reverse)
-        logger.debug(f"Sorted by {sort_by} {'desc' if reverse else 'asc'}")
+        candidates = candidates[:bisect_right(candidates, top_n, key=_SORT_KEYS["rank"])]
+    
+    # Apply the remaining filters in a single pass
+    sector_filter = sector if industry else ""
+    search_lower = search.lower()
+    if sector_filter or search_lower:
+        def matches(s) -> bool:
+            data = s.data
+            if sector_filter and data.sector != sector_filter:
+                return False
+            if search_lower and search_lower not in data.symbol_lc and search_lower not in data.description_lc:
+                return False
+            return True
+        
+        filtered = [s for s in candidates if matches(s)]
+    else:
+        filtered = candidates
+    logger.debug("Filtered by industry='%s', sector='%s', search='%s', top_n=%d: %d stocks", industry, sector, search, top_n, len(filtered))
+    
+    reverse = sort_dir == "desc"
+    if sort_by == "rank" and not reverse:
+        # Already in rank order - nothing to sort
+        pass
+    elif sort_by in _SORT_KEYS:
+        if filtered is snap.stocks:
+            filtered = snap.sorted_view(sort_by, reverse)
+        else:
+            filtered.sort(key=_SORT_KEYS[sort_by], reverse=reverse)
+        logger.debug("Sorted by %s %s", sort_by, "desc" if reverse else "asc")
     else:
-        logger.warning(f"Unknown sort field: {sort_by}")
+        logger.warning("Unknown sort field: %s", sort_by)
     
     return templates.TemplateResponse("partials/stock_table.html", {
         "request": request,
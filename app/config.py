@@ -1,6 +1,5 @@
 """Application configuration - all configurable values in one place."""
 
-from functools import lru_cache
 from pydantic_settings import BaseSettings
 
 
@@ -55,12 +54,24 @@ class Settings(BaseSettings):
     # Earnings filter (days before/after to exclude)
     earnings_exclusion_days: int = 5
     
+    # Market overview cache window in seconds (0 disables caching)
+    market_data_cache_seconds: int = 300
+    
     class Config:
         env_file = ".env"
         env_prefix = "MOMENTUM_"
 
 
-@lru_cache
+_settings = Settings()
+
+
 def get_settings() -> Settings:
-    """Get cached settings instance."""
-    return Settings()
\ No newline at end of file
+    """Get the shared settings instance."""
+    return _settings
+
+
+def reload_settings() -> Settings:
+    """Re-read settings from the environment and replace the shared instance."""
+    global _settings
+    _settings = Settings()
+    return _settings
\ No newline at end of file
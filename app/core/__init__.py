@@ -1,6 +1,8 @@
 """Core scoring modules package."""
 
-from .scoring import calculate_total_score
+from .arrays import StockArrays, build_stock_arrays
+from .constants import ScoringConstants, get_scoring_constants
+from .scoring import calculate_total_score, calculate_components_bulk, score_stock_arrays
 from .price_momentum import calculate_price_momentum
 from .volume_momentum import calculate_volume_momentum
 from .technical import calculate_technical_strength
@@ -8,10 +10,16 @@ from .breakout import calculate_breakout_score
 from .stability import calculate_stability_score
 
 __all__ = [
+    "StockArrays",
+    "build_stock_arrays",
+    "ScoringConstants",
+    "get_scoring_constants",
     "calculate_total_score",
+    "calculate_components_bulk",
+    "score_stock_arrays",
     "calculate_price_momentum",
     "calculate_volume_momentum",
     "calculate_technical_strength",
     "calculate_breakout_score",
     "calculate_stability_score",
-]
\ No newline at end of file
+]
@@ -0,0 +1,228 @@
+"""Optional Numba-compiled scoring kernels.
+
+Mirror the per-stock calculators (and confidence) in fused loops over the
+StockArrays columns. Only used when numba is installed (``pip install -e ".[fast]"``);
+otherwise scoring falls back to the NumPy *_bulk calculators.
+"""
+
+import numpy as np
+
+from .arrays import StockArrays
+from .constants import ScoringConstants
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:  # pragma: no cover - depends on the environment
+    HAS_NUMBA = False
+
+
+def _pack_constants(c: ScoringConstants) -> tuple[float, ...]:
+    """Flatten scoring constants into the positional tuple the kernel expects."""
+    return (
+        c.weight_price, c.weight_volume, c.weight_technical, c.weight_breakout, c.weight_stability,
+        c.price_weight_6m, c.price_weight_3m, c.price_weight_1m, c.price_weight_1y, c.price_weight_1w,
+        c.volume_score_cap,
+        c.high_52w_breakout_threshold, c.high_52w_near_threshold, c.high_52w_uptrend_threshold,
+        c.rel_vol_breakout_threshold, c.rel_vol_near_threshold,
+        c.mcap_mega, c.mcap_large, c.mcap_mid_high, c.mcap_mid, c.mcap_small,
+        c.beta_stable_max, c.beta_moderate_max, c.beta_high_max, c.beta_very_high_max,
+    )
+
+
+if HAS_NUMBA:
+
+    @njit(cache=True)
+    def _cap(value, cap):
+        return min(max(value, 0.0), cap)
+
+    @njit(cache=True)
+    def score_all_njit(
+        perf_6m, perf_3m, perf_1m, perf_1y, perf_1w,
+        price, high_52w, high_all_time, rel_volume, market_cap, beta,
+        sma_50, sma_200, volatility_1m, avg_volume_90d, volume_1w, volume_1d,
+        consts, out_components, out_totals,
+    ):
+        """Score every stock, writing (N, 5) components and N totals in place.
+
+        Single-threaded on purpose: kernels are called from request worker
+        threads, and Numba's parallel threading layers are not safe there.
+        """
+        (w_price, w_volume, w_technical, w_breakout, w_stability,
+         pw_6m, pw_3m, pw_1m, pw_1y, pw_1w,
+         volume_cap,
+         high_breakout, high_near, high_uptrend,
+         rel_vol_breakout, rel_vol_near,
+         mcap_mega, mcap_large, mcap_mid_high, mcap_mid, mcap_small,
+         beta_stable, beta_moderate, beta_high, beta_very_high) = consts
+
+        for i in range(price.shape[0]):
+            p = price[i]
+
+            # Price momentum
+            price_mom = (perf_6m[i] * pw_6m + perf_3m[i] * pw_3m + perf_1m[i] * pw_1m
+                         + perf_1y[i] * pw_1y + perf_1w[i] * pw_1w)
+
+            # Volume momentum
+            weekly = 0.0
+            daily = 0.0
+            if avg_volume_90d[i] > 0:
+                ratio = (volume_1w[i] / 5) / avg_volume_90d[i]
+                if ratio > 1:
+                    weekly = _cap((ratio - 1) * 10, volume_cap)
+                ratio = volume_1d[i] / avg_volume_90d[i]
+                if ratio > 1:
+                    daily = _cap((ratio - 1) * 10, volume_cap)
+            rel_vol = 0.0
+            if rel_volume[i] > 1:
+                rel_vol = _cap((rel_volume[i] - 1) * 10, volume_cap)
+            volume_mom = weekly * 0.40 + daily * 0.30 + rel_vol * 0.30
+
+            # Technical strength
+            trend = 0.0
+            if sma_50[i] > 0:
+                trend += min((p / sma_50[i] - 1) * 50, 25.0)
+            if sma_200[i] > 0:
+                trend += min((p / sma_200[i] - 1) * 25, 25.0)
+            trend = min(max(trend, 0.0), 50.0)
+            proximity = (p / high_52w[i]) * 100 if high_52w[i] > 0 else 0.0
+            vol = volatility_1m[i]
+            if vol < 3:
+                vol_adj = 15.0
+            elif vol < 5:
+                vol_adj = 10.0
+            elif vol < 8:
+                vol_adj = 5.0
+            else:
+                vol_adj = 0.0
+            technical = trend * 0.40 + proximity * 0.40 + vol_adj * 0.20
+
+            # Breakout
+            proximity_52w = (p / high_52w[i]) * 100 if high_52w[i] > 0 else 50.0
+            if high_all_time[i] <= 0 or high_all_time[i] < p:
+                proximity_ath = proximity_52w
+            else:
+                proximity_ath = (p / high_all_time[i]) * 100
+            if proximity_52w >= high_breakout:
+                base = 25.0 if rel_volume[i] >= rel_vol_breakout else 20.0
+            elif proximity_52w >= high_near:
+                base = 18.0 if rel_volume[i] >= rel_vol_near else 15.0
+            elif proximity_52w >= high_uptrend:
+                base = 12.0
+            elif proximity_52w >= 70:
+                base = 8.0
+            else:
+                base = 5.0
+            if proximity_ath >= 95:
+                multiplier = 1.3
+            elif proximity_ath >= 85:
+                multiplier = 1.1
+            elif proximity_ath >= 70:
+                multiplier = 0.9
+            elif proximity_ath >= 50:
+                multiplier = 0.7
+            elif proximity_ath >= 30:
+                multiplier = 0.5
+            else:
+                multiplier = 0.3
+            breakout = min(base * multiplier, 30.0)
+
+            # Stability
+            mcap_billions = market_cap[i] / 1_000_000_000
+            if mcap_billions >= mcap_mega:
+                mcap_score = 20.0
+            elif mcap_billions >= mcap_large:
+                mcap_score = 16.0
+            elif mcap_billions >= mcap_mid_high:
+                mcap_score = 12.0
+            elif mcap_billions >= mcap_mid:
+                mcap_score = 8.0
+            elif mcap_billions >= mcap_small:
+                mcap_score = 5.0
+            else:
+                mcap_score = 2.0
+            b = beta[i]
+            if 0.5 <= b <= beta_stable:
+                beta_score = 15.0
+            elif b <= beta_moderate:
+                beta_score = 12.0
+            elif b <= beta_high:
+                beta_score = 8.0
+            elif b <= beta_very_high:
+                beta_score = 4.0
+            else:
+                beta_score = 0.0
+            stability = mcap_score * 0.60 + beta_score * 0.40
+
+            out_components[i, 0] = price_mom
+            out_components[i, 1] = volume_mom
+            out_components[i, 2] = technical
+            out_components[i, 3] = breakout
+            out_components[i, 4] = stability
+            out_totals[i] = (price_mom * w_price + volume_mom * w_volume + technical * w_technical
+                             + breakout * w_breakout + stability * w_stability)
+
+    @njit(cache=True)
+    def confidence_all_njit(
+        price, sma_50, sma_200, high_52w, high_all_time, rel_volume,
+        perf_1w, perf_1m, perf_3m, perf_6m, volatility_1m,
+        components, out,
+    ):
+        """Compute confidence for every stock into out, mirroring calculate_confidence."""
+        for i in range(price.shape[0]):
+            p = price[i]
+            score = 0.0
+            if sma_50[i] > 0 and p > sma_50[i]:
+                score += 15.0
+            if sma_200[i] > 0 and p > sma_200[i]:
+                score += 10.0
+            if high_52w[i] > 0 and p / high_52w[i] > 0.90:
+                score += 10.0
+            if high_all_time[i] > 0:
+                # Above the all-time high counts like being at it
+                ath_proximity = p / high_all_time[i]
+                if ath_proximity >= 0.95:
+                    score += 20.0
+                elif ath_proximity >= 0.85:
+                    score += 15.0
+                elif ath_proximity >= 0.70:
+                    score += 10.0
+                elif ath_proximity >= 0.50:
+                    score += 5.0
+            if rel_volume[i] > 1.2:
+                score += 10.0
+            if perf_1w[i] > 0 and perf_1m[i] > 0 and perf_3m[i] > 0 and perf_6m[i] > 0:
+                score += 15.0
+            if volatility_1m[i] < 5:
+                score += 5.0
+            total_momentum = components[i, 0] + components[i, 1]
+            score += min((total_momentum / 60) * 15, 15.0)
+            out[i] = min(score, 100.0)
+
+
+def calculate_components_numba(
+    arrays: StockArrays, constants: ScoringConstants
+) -> tuple[np.ndarray, np.ndarray]:
+    """Run the compiled kernel; same contract as calculate_components_bulk."""
+    count = len(arrays)
+    components = np.empty((count, 5))
+    totals = np.empty(count)
+    score_all_njit(
+        arrays.perf_6m, arrays.perf_3m, arrays.perf_1m, arrays.perf_1y, arrays.perf_1w,
+        arrays.price, arrays.high_52w, arrays.high_all_time, arrays.rel_volume,
+        arrays.market_cap, arrays.beta, arrays.sma_50, arrays.sma_200, arrays.volatility_1m,
+        arrays.avg_volume_90d, arrays.volume_1w, arrays.volume_1d,
+        _pack_constants(constants), components, totals,
+    )
+    return components, totals
+
+
+def calculate_confidence_numba(arrays: StockArrays, components: np.ndarray) -> np.ndarray:
+    """Run the compiled confidence kernel; same contract as calculate_confidence_bulk."""
+    out = np.empty(len(arrays))
+    confidence_all_njit(
+        arrays.price, arrays.sma_50, arrays.sma_200, arrays.high_52w, arrays.high_all_time,
+        arrays.rel_volume, arrays.perf_1w, arrays.perf_1m, arrays.perf_3m, arrays.perf_6m,
+        arrays.volatility_1m, components, out,
+    )
+    return out
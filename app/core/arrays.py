@@ -0,0 +1,49 @@
+"""Columnar (structure-of-arrays) view of stock data for batch scoring."""
+
+from dataclasses import dataclass, fields
+from operator import attrgetter
+from typing import Sequence
+
+import numpy as np
+
+from ..models import StockData
+
+
+@dataclass(frozen=True)
+class StockArrays:
+    """Parallel float64 columns, one entry per stock - immutable."""
+
+    perf_6m: np.ndarray
+    perf_3m: np.ndarray
+    perf_1m: np.ndarray
+    perf_1y: np.ndarray
+    perf_1w: np.ndarray
+    price: np.ndarray
+    high_52w: np.ndarray
+    high_all_time: np.ndarray
+    rel_volume: np.ndarray
+    market_cap: np.ndarray
+    beta: np.ndarray
+    sma_50: np.ndarray
+    sma_200: np.ndarray
+    volatility_1m: np.ndarray
+    avg_volume_90d: np.ndarray
+    volume_1w: np.ndarray
+    volume_1d: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.price)
+
+
+_FIELD_NAMES = tuple(f.name for f in fields(StockArrays))
+_get_fields = attrgetter(*_FIELD_NAMES)
+
+
+def build_stock_arrays(stocks: Sequence[StockData]) -> StockArrays:
+    """Stack the numeric StockData fields used for scoring into columns.
+    
+    All fields of a stock are read in one attrgetter call; the (N, fields)
+    matrix is then transposed so every column is contiguous.
+    """
+    rows = np.array([_get_fields(s) for s in stocks], dtype=np.float64).reshape(len(stocks), len(_FIELD_NAMES))
+    return StockArrays(*np.ascontiguousarray(rows.T))
@@ -1,16 +1,19 @@
 """Breakout score calculation - pure function."""
 
-from ..config import get_settings
+import numpy as np
+
 from ..models import StockData
+from .arrays import StockArrays
+from .constants import ScoringConstants, get_scoring_constants
 
 
-def calculate_breakout_score(stock: StockData) -> float:
+def calculate_breakout_score(stock: StockData, constants: ScoringConstants | None = None) -> float:
     """Calculate breakout potential score based on 52W proximity, ATH proximity, and volume.
     
     This score heavily rewards stocks trading near their all-time highs.
     Stocks far from ATH are penalized significantly.
     """
-    settings = get_settings()
+    c = constants or get_scoring_constants()
     
     # Calculate 52-week high proximity
     if stock.high_52w <= 0:
@@ -26,18 +29,18 @@ def calculate_breakout_score(stock: StockData) -> float:
         proximity_ath = (stock.price / stock.high_all_time) * 100
     
     # Base score from 52-week high proximity
-    if proximity_52w >= settings.high_52w_breakout_threshold:  # >= 95%
+    if proximity_52w >= c.high_52w_breakout_threshold:  # >= 95%
         # Near or at 52-week high
-        if stock.rel_volume >= settings.rel_vol_breakout_threshold:
+        if stock.rel_volume >= c.rel_vol_breakout_threshold:
             base_score = 25.0  # Strong breakout signal
         else:
             base_score = 20.0
-    elif proximity_52w >= settings.high_52w_near_threshold:  # >= 90%
-        if stock.rel_volume >= settings.rel_vol_near_threshold:
+    elif proximity_52w >= c.high_52w_near_threshold:  # >= 90%
+        if stock.rel_volume >= c.rel_vol_near_threshold:
             base_score = 18.0
         else:
             base_score = 15.0
-    elif proximity_52w >= settings.high_52w_uptrend_threshold:  # >= 80%
+    elif proximity_52w >= c.high_52w_uptrend_threshold:  # >= 80%
         base_score = 12.0
     elif proximity_52w >= 70:
         base_score = 8.0
@@ -68,4 +71,41 @@ def calculate_breakout_score(stock: StockData) -> float:
     final_score = base_score * ath_multiplier
     
     # Cap at max score
-    return min(final_score, 30.0)
\ No newline at end of file
+    return min(final_score, 30.0)
+
+
+def calculate_breakout_score_bulk(arrays: StockArrays, constants: ScoringConstants | None = None) -> np.ndarray:
+    """Calculate breakout scores for all stocks - see calculate_breakout_score."""
+    c = constants or get_scoring_constants()
+    price = arrays.price
+    rel_volume = arrays.rel_volume
+    
+    has_52w = arrays.high_52w > 0
+    proximity_52w = np.where(has_52w, price / np.where(has_52w, arrays.high_52w, 1.0) * 100, 50.0)
+    
+    has_ath = (arrays.high_all_time > 0) & (arrays.high_all_time >= price)
+    proximity_ath = np.where(has_ath, price / np.where(has_ath, arrays.high_all_time, 1.0) * 100, proximity_52w)
+    
+    base_score = np.select(
+        [
+            proximity_52w >= c.high_52w_breakout_threshold,
+            proximity_52w >= c.high_52w_near_threshold,
+            proximity_52w >= c.high_52w_uptrend_threshold,
+            proximity_52w >= 70,
+        ],
+        [
+            np.where(rel_volume >= c.rel_vol_breakout_threshold, 25.0, 20.0),
+            np.where(rel_volume >= c.rel_vol_near_threshold, 18.0, 15.0),
+            12.0,
+            8.0,
+        ],
+        default=5.0,
+    )
+    
+    ath_multiplier = np.select(
+        [proximity_ath >= 95, proximity_ath >= 85, proximity_ath >= 70, proximity_ath >= 50, proximity_ath >= 30],
+        [1.3, 1.1, 0.9, 0.7, 0.5],
+        default=0.3,
+    )
+    
+    return np.minimum(base_score * ath_multiplier, 30.0)
@@ -0,0 +1,97 @@
+"""Scoring constants - a flat snapshot of the settings used by the scorers."""
+
+from dataclasses import dataclass, field, fields
+
+import numpy as np
+
+from ..config import Settings, get_settings
+
+
+@dataclass(frozen=True, slots=True)
+class ScoringConstants:
+    """Scoring weights and thresholds captured once per batch - immutable."""
+    
+    # Component weights
+    weight_price: float
+    weight_volume: float
+    weight_technical: float
+    weight_breakout: float
+    weight_stability: float
+    
+    # Price momentum sub-weights
+    price_weight_6m: float
+    price_weight_3m: float
+    price_weight_1m: float
+    price_weight_1y: float
+    price_weight_1w: float
+    
+    # Volume scoring caps
+    volume_score_cap: float
+    
+    # Technical thresholds
+    high_52w_breakout_threshold: float
+    high_52w_near_threshold: float
+    high_52w_uptrend_threshold: float
+    rel_vol_breakout_threshold: float
+    rel_vol_near_threshold: float
+    
+    # Market cap tiers (in billions)
+    mcap_mega: float
+    mcap_large: float
+    mcap_mid_high: float
+    mcap_mid: float
+    mcap_small: float
+    
+    # Beta thresholds
+    beta_stable_max: float
+    beta_moderate_max: float
+    beta_high_max: float
+    beta_very_high_max: float
+    
+    # Derived: price sub-weights ordered (6m, 3m, 1m, 1y, 1w) for a single dot product
+    price_weights: np.ndarray = field(init=False, repr=False, compare=False)
+    # Derived: component weights in ScoreComponents field order, for components @ weights
+    component_weights: np.ndarray = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        price_weights = np.array([
+            self.price_weight_6m,
+            self.price_weight_3m,
+            self.price_weight_1m,
+            self.price_weight_1y,
+            self.price_weight_1w,
+        ])
+        price_weights.flags.writeable = False
+        object.__setattr__(self, "price_weights", price_weights)
+        
+        component_weights = np.array([
+            self.weight_price,
+            self.weight_volume,
+            self.weight_technical,
+            self.weight_breakout,
+            self.weight_stability,
+        ])
+        component_weights.flags.writeable = False
+        object.__setattr__(self, "component_weights", component_weights)
+    
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "ScoringConstants":
+        """Snapshot the scoring-related values from application settings."""
+        return cls(**{f.name: getattr(settings, f.name) for f in fields(cls) if f.init})
+
+
+# Default snapshot and the settings instance it was built from
+_default: tuple[Settings, ScoringConstants] | None = None
+
+
+def get_scoring_constants() -> ScoringConstants:
+    """Get scoring constants for callers that do not pass their own.
+    
+    The snapshot is rebuilt automatically when reload_settings() swaps the
+    settings instance.
+    """
+    global _default
+    settings = get_settings()
+    if _default is None or _default[0] is not settings:
+        _default = (settings, ScoringConstants.from_settings(settings))
+    return _default[1]
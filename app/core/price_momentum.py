@@ -1,17 +1,30 @@
 """Price momentum calculation - pure function."""
 
-from ..config import get_settings
+import numpy as np
+
 from ..models import StockData
+from .arrays import StockArrays
+from .constants import ScoringConstants, get_scoring_constants
 
 
-def calculate_price_momentum(stock: StockData) -> float:
+def calculate_price_momentum(stock: StockData, constants: ScoringConstants | None = None) -> float:
     """Calculate weighted price momentum score from performance metrics."""
-    settings = get_settings()
+    c = constants or get_scoring_constants()
     
     return (
-        stock.perf_6m * settings.price_weight_6m +
-        stock.perf_3m * settings.price_weight_3m +
-        stock.perf_1m * settings.price_weight_1m +
-        stock.perf_1y * settings.price_weight_1y +
-        stock.perf_1w * settings.price_weight_1w
-    )
\ No newline at end of file
+        stock.perf_6m * c.price_weight_6m +
+        stock.perf_3m * c.price_weight_3m +
+        stock.perf_1m * c.price_weight_1m +
+        stock.perf_1y * c.price_weight_1y +
+        stock.perf_1w * c.price_weight_1w
+    )
+
+
+def calculate_price_momentum_bulk(arrays: StockArrays, constants: ScoringConstants | None = None) -> np.ndarray:
+    """Calculate price momentum for all stocks as a single matrix-vector product."""
+    c = constants or get_scoring_constants()
+    perf = np.column_stack((
+        arrays.perf_6m, arrays.perf_3m, arrays.perf_1m, arrays.perf_1y, arrays.perf_1w,
+    ))
+    
+    return perf @ c.price_weights
@@ -1,33 +1,70 @@
 """Main scoring orchestration - combines all component scores."""
 
-from ..config import get_settings
+import numpy as np
+
 from ..models import StockData, ScoreComponents
-from .price_momentum import calculate_price_momentum
-from .volume_momentum import calculate_volume_momentum
-from .technical import calculate_technical_strength
-from .breakout import calculate_breakout_score
-from .stability import calculate_stability_score
+from ._scoring_numba import HAS_NUMBA, calculate_components_numba
+from .arrays import StockArrays
+from .constants import ScoringConstants, get_scoring_constants
+from .price_momentum import calculate_price_momentum, calculate_price_momentum_bulk
+from .volume_momentum import calculate_volume_momentum, calculate_volume_momentum_bulk
+from .technical import calculate_technical_strength, calculate_technical_strength_bulk
+from .breakout import calculate_breakout_score, calculate_breakout_score_bulk
+from .stability import calculate_stability_score, calculate_stability_score_bulk
 
 
-def calculate_components(stock: StockData) -> ScoreComponents:
+def calculate_components(stock: StockData, constants: ScoringConstants | None = None) -> ScoreComponents:
     """Calculate all score components for a stock."""
+    c = constants or get_scoring_constants()
+    
     return ScoreComponents(
-        price_momentum=calculate_price_momentum(stock),
-        volume_momentum=calculate_volume_momentum(stock),
-        technical_strength=calculate_technical_strength(stock),
-        breakout_score=calculate_breakout_score(stock),
-        stability_score=calculate_stability_score(stock),
+        price_momentum=calculate_price_momentum(stock, c),
+        volume_momentum=calculate_volume_momentum(stock, c),
+        technical_strength=calculate_technical_strength(stock, c),
+        breakout_score=calculate_breakout_score(stock, c),
+        stability_score=calculate_stability_score(stock, c),
     )
 
 
-def calculate_total_score(components: ScoreComponents) -> float:
+def calculate_total_score(components: ScoreComponents, constants: ScoringConstants | None = None) -> float:
     """Calculate weighted total score from components."""
-    settings = get_settings()
+    c = constants or get_scoring_constants()
     
     return (
-        components.price_momentum * settings.weight_price +
-        components.volume_momentum * settings.weight_volume +
-        components.technical_strength * settings.weight_technical +
-        components.breakout_score * settings.weight_breakout +
-        components.stability_score * settings.weight_stability
-    )
\ No newline at end of file
+        components.price_momentum * c.weight_price +
+        components.volume_momentum * c.weight_volume +
+        components.technical_strength * c.weight_technical +
+        components.breakout_score * c.weight_breakout +
+        components.stability_score * c.weight_stability
+    )
+
+
+def calculate_components_bulk(
+    arrays: StockArrays, constants: ScoringConstants | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """Calculate all score components and totals for every stock at once.
+    
+    Returns:
+        (components, totals) where components is an (N, 5) array whose columns
+        follow ScoreComponents field order, and totals is the weighted sum.
+    """
+    c = constants or get_scoring_constants()
+    components = np.column_stack((
+        calculate_price_momentum_bulk(arrays, c),
+        calculate_volume_momentum_bulk(arrays, c),
+        calculate_technical_strength_bulk(arrays, c),
+        calculate_breakout_score_bulk(arrays, c),
+        calculate_stability_score_bulk(arrays, c),
+    ))
+    
+    return components, components @ c.component_weights
+
+
+def score_stock_arrays(
+    arrays: StockArrays, constants: ScoringConstants | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """Score all stocks with the compiled kernel when numba is available, else NumPy."""
+    c = constants or get_scoring_constants()
+    if HAS_NUMBA:
+        return calculate_components_numba(arrays, c)
+    return calculate_components_bulk(arrays, c)
@@ -1,45 +1,76 @@
 """Stability score calculation - pure function."""
 
-from ..config import get_settings
+import numpy as np
+
 from ..models import StockData
+from .arrays import StockArrays
+from .constants import ScoringConstants, get_scoring_constants
+
+# Score for each market cap tier and beta tier, lowest tier first
+_MCAP_SCORES = np.array([2.0, 5.0, 8.0, 12.0, 16.0, 20.0])
+_BETA_SCORES = np.array([15.0, 12.0, 8.0, 4.0, 0.0])
 
 
-def _mcap_score(market_cap: float) -> float:
+def _mcap_score(market_cap: float, c: ScoringConstants) -> float:
     """Calculate market cap score - larger caps get higher scores."""
-    settings = get_settings()
     mcap_billions = market_cap / 1_000_000_000
     
-    if mcap_billions >= settings.mcap_mega:
+    if mcap_billions >= c.mcap_mega:
         return 20.0
-    if mcap_billions >= settings.mcap_large:
+    if mcap_billions >= c.mcap_large:
         return 16.0
-    if mcap_billions >= settings.mcap_mid_high:
+    if mcap_billions >= c.mcap_mid_high:
         return 12.0
-    if mcap_billions >= settings.mcap_mid:
+    if mcap_billions >= c.mcap_mid:
         return 8.0
-    if mcap_billions >= settings.mcap_small:
+    if mcap_billions >= c.mcap_small:
         return 5.0
     return 2.0
 
 
-def _beta_score(beta: float) -> float:
+def _beta_score(beta: float, c: ScoringConstants) -> float:
     """Calculate beta score - moderate beta is ideal."""
-    settings = get_settings()
-    
-    if 0.5 <= beta <= settings.beta_stable_max:
+    if 0.5 <= beta <= c.beta_stable_max:
         return 15.0
-    if beta <= settings.beta_moderate_max:
+    if beta <= c.beta_moderate_max:
         return 12.0
-    if beta <= settings.beta_high_max:
+    if beta <= c.beta_high_max:
         return 8.0
-    if beta <= settings.beta_very_high_max:
+    if beta <= c.beta_very_high_max:
         return 4.0
     return 0.0
 
 
-def calculate_stability_score(stock: StockData) -> float:
+def calculate_stability_score(stock: StockData, constants: ScoringConstants | None = None) -> float:
     """Calculate stability score from market cap and beta."""
-    mcap = _mcap_score(stock.market_cap) * 0.60
-    beta = _beta_score(stock.beta) * 0.40
+    c = constants or get_scoring_constants()
+    mcap = _mcap_score(stock.market_cap, c) * 0.60
+    beta = _beta_score(stock.beta, c) * 0.40
+    
+    return mcap + beta
+
+
+def _mcap_score_bulk(market_cap: np.ndarray, c: ScoringConstants) -> np.ndarray:
+    """Calculate market cap scores - larger caps get higher scores."""
+    # Ascending tier boundaries (billions)
+    thresholds = np.array([c.mcap_small, c.mcap_mid, c.mcap_mid_high, c.mcap_large, c.mcap_mega])
+    tier = np.searchsorted(thresholds, market_cap / 1_000_000_000, side="right")
+    return _MCAP_SCORES[tier]
+
+
+def _beta_score_bulk(beta: np.ndarray, c: ScoringConstants) -> np.ndarray:
+    """Calculate beta scores - moderate beta is ideal."""
+    # Inclusive upper bound of each beta tier
+    thresholds = np.array([c.beta_stable_max, c.beta_moderate_max, c.beta_high_max, c.beta_very_high_max])
+    scores = _BETA_SCORES[np.searchsorted(thresholds, beta, side="left")]
+    # Beta below 0.5 is not "stable" and falls through to the moderate tier
+    return np.where(beta < 0.5, _BETA_SCORES[1], scores)
+
+
+def calculate_stability_score_bulk(arrays: StockArrays, constants: ScoringConstants | None = None) -> np.ndarray:
+    """Calculate stability scores from market cap and beta for all stocks."""
+    c = constants or get_scoring_constants()
+    mcap = _mcap_score_bulk(arrays.market_cap, c) * 0.60
+    beta = _beta_score_bulk(arrays.beta, c) * 0.40
     
-    return mcap + beta
\ No newline at end of file
+    return mcap + beta
@@ -1,6 +1,10 @@
 """Technical strength calculation - pure function."""
 
+import numpy as np
+
 from ..models import StockData
+from .arrays import StockArrays
+from .constants import ScoringConstants
 
 
 def _trend_score(stock: StockData) -> float:
@@ -36,10 +40,37 @@ def _volatility_adjustment(volatility: float) -> float:
     return 0.0
 
 
-def calculate_technical_strength(stock: StockData) -> float:
-    """Calculate technical strength score."""
+def calculate_technical_strength(stock: StockData, constants: ScoringConstants | None = None) -> float:
+    """Calculate technical strength score.
+    
+    Uses no configurable settings; constants is accepted for a uniform signature.
+    """
     trend = _trend_score(stock) * 0.40
     proximity = _proximity_52w(stock) * 0.40
     volatility_adj = _volatility_adjustment(stock.volatility_1m) * 0.20
     
-    return trend + proximity + volatility_adj
\ No newline at end of file
+    return trend + proximity + volatility_adj
+
+
+def calculate_technical_strength_bulk(arrays: StockArrays, constants: ScoringConstants | None = None) -> np.ndarray:
+    """Calculate technical strength scores for all stocks in one pass.
+    
+    A missing 52-week high is treated as infinite so its proximity scores 0.
+    """
+    price = arrays.price
+    has_sma_50 = arrays.sma_50 > 0
+    has_sma_200 = arrays.sma_200 > 0
+    sma_50 = np.where(has_sma_50, arrays.sma_50, 1.0)
+    sma_200 = np.where(has_sma_200, arrays.sma_200, 1.0)
+    high_52w = np.where(arrays.high_52w > 0, arrays.high_52w, np.inf)
+    volatility = arrays.volatility_1m
+    
+    trend = np.clip(
+        np.where(has_sma_50, np.minimum((price / sma_50 - 1) * 50, 25), 0.0)
+        + np.where(has_sma_200, np.minimum((price / sma_200 - 1) * 25, 25), 0.0),
+        0, 50,
+    )
+    proximity = price / high_52w * 100
+    volatility_adj = np.select([volatility < 3, volatility < 5, volatility < 8], [15.0, 10.0, 5.0], default=0.0)
+    
+    return trend * 0.40 + proximity * 0.40 + volatility_adj * 0.20
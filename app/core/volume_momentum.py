@@ -1,7 +1,10 @@
 """Volume momentum calculation - pure function."""
 
-from ..config import get_settings
+import numpy as np
+
 from ..models import StockData
+from .arrays import StockArrays
+from .constants import ScoringConstants, get_scoring_constants
 
 
 def _cap_score(value: float, cap: float) -> float:
@@ -31,13 +34,28 @@ def _relative_volume_score(stock: StockData, cap: float) -> float:
     return _cap_score((stock.rel_volume - 1) * 10, cap) if stock.rel_volume > 1 else 0.0
 
 
-def calculate_volume_momentum(stock: StockData) -> float:
+def calculate_volume_momentum(stock: StockData, constants: ScoringConstants | None = None) -> float:
     """Calculate volume momentum score from volume metrics."""
-    settings = get_settings()
-    cap = settings.volume_score_cap
+    cap = (constants or get_scoring_constants()).volume_score_cap
     
     weekly = _weekly_volume_ratio(stock, cap) * 0.40
     daily = _daily_volume_ratio(stock, cap) * 0.30
     rel_vol = _relative_volume_score(stock, cap) * 0.30
     
-    return weekly + daily + rel_vol
\ No newline at end of file
+    return weekly + daily + rel_vol
+
+
+def calculate_volume_momentum_bulk(arrays: StockArrays, constants: ScoringConstants | None = None) -> np.ndarray:
+    """Calculate volume momentum scores for all stocks in one pass.
+    
+    Clipping at 0 already zeroes ratios at or below 1, and a missing 90-day
+    average is treated as infinite so both volume ratios score 0.
+    """
+    cap = (constants or get_scoring_constants()).volume_score_cap
+    avg_volume = np.where(arrays.avg_volume_90d > 0, arrays.avg_volume_90d, np.inf)
+    
+    weekly = np.clip((arrays.volume_1w / 5 / avg_volume - 1) * 10, 0, cap) * 0.40
+    daily = np.clip((arrays.volume_1d / avg_volume - 1) * 10, 0, cap) * 0.30
+    rel_vol = np.clip((arrays.rel_volume - 1) * 10, 0, cap) * 0.30
+    
+    return weekly + daily + rel_vol
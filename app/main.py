@@ -43,8 +43,8 @@ def setup_logging():
 logger = setup_logging()
 settings = get_settings()
 
-logger.info(f"Starting {settings.app_name} v{settings.app_version}")
-logger.info(f"Debug mode: {settings.debug}")
+logger.info("Starting %s v%s", settings.app_name, settings.app_version)
+logger.info("Debug mode: %s", settings.debug)
 
 app = FastAPI(
     title=settings.app_name,
@@ -55,7 +55,7 @@ app = FastAPI(
 # Create static directory if it doesn't exist
 static_dir = Path(__file__).parent.parent / "static"
 static_dir.mkdir(exist_ok=True)
-logger.info(f"Static directory: {static_dir}")
+logger.info("Static directory: %s", static_dir)
 
 # Mount static files
 app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
@@ -1,5 +1,6 @@
 """Data models package."""
 
 from .stock import StockData, ScoreComponents, RankedStock
+from .ranked import RankedColumns, RankedStockTable
 
-__all__ = ["StockData", "ScoreComponents", "RankedStock"]
\ No newline at end of file
+__all__ = ["StockData", "ScoreComponents", "RankedStock", "RankedColumns", "RankedStockTable"]
\ No newline at end of file
@@ -0,0 +1,118 @@
+"""Columnar ranking results - RankedStock objects built on demand."""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Iterator, overload
+
+import numpy as np
+
+from .stock import StockData, ScoreComponents, RankedStock
+
+
+@dataclass(frozen=True)
+class RankedColumns:
+    """Per-stock ranking results as parallel arrays in rank order - immutable."""
+
+    components: np.ndarray  # (N, 5), columns in ScoreComponents field order
+    total_score: np.ndarray
+    confidence: np.ndarray
+    is_top: np.ndarray
+    earnings_safe: np.ndarray
+    # Stock fields used for analytics and grouping
+    symbol: np.ndarray  # object array of str
+    industry: np.ndarray  # object array of str
+    sector: np.ndarray  # object array of str
+    price: np.ndarray
+    high_52w: np.ndarray
+    perf_1w: np.ndarray
+    perf_1m: np.ndarray
+    perf_6m: np.ndarray
+    rel_volume: np.ndarray
+
+    @classmethod
+    def from_ranked(cls, stocks: Sequence[RankedStock]) -> "RankedColumns":
+        """Build columns from already materialized RankedStock objects.
+        
+        Numeric fields are read in one pass into a single (N, 15) array.
+        """
+        rows = np.empty((len(stocks), 15))
+        for i, s in enumerate(stocks):
+            c, d = s.components, s.data
+            rows[i] = (
+                c.price_momentum, c.volume_momentum, c.technical_strength, c.breakout_score, c.stability_score,
+                s.total_score, s.confidence, s.is_top, s.earnings_safe,
+                d.price, d.high_52w, d.perf_1w, d.perf_1m, d.perf_6m, d.rel_volume,
+            )
+        return cls(
+            components=rows[:, :5],
+            total_score=rows[:, 5],
+            confidence=rows[:, 6],
+            is_top=rows[:, 7].astype(bool),
+            earnings_safe=rows[:, 8].astype(bool),
+            symbol=np.array([s.data.symbol for s in stocks], dtype=object),
+            industry=np.array([s.data.industry for s in stocks], dtype=object),
+            sector=np.array([s.data.sector for s in stocks], dtype=object),
+            price=rows[:, 9],
+            high_52w=rows[:, 10],
+            perf_1w=rows[:, 11],
+            perf_1m=rows[:, 12],
+            perf_6m=rows[:, 13],
+            rel_volume=rows[:, 14],
+        )
+
+
+class RankedStockTable(Sequence):
+    """Rank-ordered sequence of RankedStock backed by RankedColumns.
+
+    Index i holds the stock ranked i + 1. RankedStock objects are created the
+    first time they are accessed and reused afterwards, so aggregate consumers
+    can read ``columns`` without materializing every row.
+    """
+
+    def __init__(self, stocks: Sequence[StockData], columns: RankedColumns):
+        self.stocks = stocks
+        self.columns = columns
+        self._rows: list[RankedStock | None] = [None] * len(stocks)
+
+    def __len__(self) -> int:
+        return len(self.stocks)
+
+    @overload
+    def __getitem__(self, index: int) -> RankedStock: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[RankedStock]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("RankedStockTable index out of range")
+        return self._row(index)
+
+    def __iter__(self) -> Iterator[RankedStock]:
+        for i in range(len(self)):
+            yield self._row(i)
+
+    def top(self, k: int) -> list[RankedStock]:
+        """Materialize only the k best-ranked stocks."""
+        return self[:k]
+
+    def _row(self, i: int) -> RankedStock:
+        """Materialize (once) the RankedStock at rank position i."""
+        row = self._rows[i]
+        if row is None:
+            cols = self.columns
+            row = RankedStock(
+                data=self.stocks[i],
+                components=ScoreComponents(*cols.components[i].tolist()),
+                total_score=float(cols.total_score[i]),
+                confidence=float(cols.confidence[i]),
+                rank=i + 1,
+                is_top=bool(cols.is_top[i]),
+                earnings_safe=bool(cols.earnings_safe[i]),
+            )
+            self._rows[i] = row
+        return row
@@ -1,11 +1,11 @@
 """Stock data models - immutable data structures."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
 from typing import Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockData:
     """Raw stock data from CSV - immutable."""
     
@@ -35,9 +35,19 @@ class StockData:
     rel_volume: float
     volume_change: float
     indexes: str = ""
+    
+    # Lowercased copies for case-insensitive search and sorting
+    symbol_lc: str = field(init=False, repr=False, compare=False)
+    description_lc: str = field(init=False, repr=False, compare=False)
+    industry_lc: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "symbol_lc", self.symbol.lower())
+        object.__setattr__(self, "description_lc", self.description.lower())
+        object.__setattr__(self, "industry_lc", self.industry.lower())
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScoreComponents:
     """Individual score components - immutable."""
     
@@ -48,7 +58,7 @@ class ScoreComponents:
     stability_score: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RankedStock:
     """Stock with calculated scores - immutable."""
     
@@ -3,9 +3,12 @@
 import logging
 from dataclasses import dataclass
 from collections import Counter
+from operator import attrgetter
 from typing import Sequence
 
-from ..models import RankedStock
+import numpy as np
+
+from ..models import RankedStock, RankedColumns, RankedStockTable
 
 logger = logging.getLogger(__name__)
 
@@ -38,86 +41,90 @@ class Analytics:
     breakout_candidates: list[str]  # Near 52-week high
 
 
-def _get_trending_industries(stocks: Sequence[RankedStock], limit: int = 5) -> list[IndustryStats]:
+def _get_trending_industries(columns: RankedColumns, limit: int = 5) -> list[IndustryStats]:
     """Get top industries by average score."""
-    industry_stocks: dict[str, list[RankedStock]] = {}
-    
-    for stock in stocks:
-        industry = stock.data.industry
-        if industry not in industry_stocks:
-            industry_stocks[industry] = []
-        industry_stocks[industry].append(stock)
+    # Per-industry stock count, score sum and first (best-ranked) row, gathered in one pass
+    names, first, inverse, counts = np.unique(
+        columns.industry, return_index=True, return_inverse=True, return_counts=True
+    )
+    sums = np.bincount(inverse, weights=columns.total_score, minlength=len(names))
     
-    # Calculate avg score per industry
+    # Calculate avg score per industry, visiting industries in order of first appearance
     industry_stats = []
-    for name, ind_stocks in industry_stocks.items():
-        if len(ind_stocks) < 2:  # Skip industries with only 1 stock
+    for i in np.argsort(first, kind="stable"):
+        count = int(counts[i])
+        if count < 2:  # Skip industries with only 1 stock
             continue
-        avg = sum(s.total_score for s in ind_stocks) / len(ind_stocks)
-        top = min(ind_stocks, key=lambda s: s.rank)
+        top = first[i]
         # Get sector from top stock (all stocks in same industry typically have same sector)
-        sector = top.data.sector
-        industry_stats.append(IndustryStats(name, sector, len(ind_stocks), avg, top.data.symbol))
+        industry_stats.append(IndustryStats(
+            names[i], columns.sector[top], count, float(sums[i] / count), columns.symbol[top]
+        ))
     
     # Sort by avg score
-    industry_stats.sort(key=lambda x: x.avg_score, reverse=True)
-    logger.debug(f"Found {len(industry_stats)} industries with 2+ stocks")
+    industry_stats.sort(key=attrgetter("avg_score"), reverse=True)
+    logger.debug("Found %d industries with 2+ stocks", len(industry_stats))
     return industry_stats[:limit]
 
 
-def _get_sector_distribution(stocks: Sequence[RankedStock]) -> dict[str, int]:
+def _get_sector_distribution(columns: RankedColumns) -> dict[str, int]:
     """Get stock count by sector."""
-    return dict(Counter(s.data.sector for s in stocks))
+    # A plain dict: dataclasses.asdict would rebuild a Counter from (key, value) pairs
+    return dict(Counter(columns.sector.tolist()))
 
 
-def _get_top_movers_1w(stocks: Sequence[RankedStock], limit: int = 5) -> list[str]:
+def _topk_symbols(keys: np.ndarray, symbols: np.ndarray, k: int) -> list[str]:
+    """Get the symbols with the k largest keys, largest first; ties keep rank order."""
+    if k >= len(keys):
+        top = np.argsort(-keys, kind="stable")
+    else:
+        # Partition out the k largest, then stable-sort everything tied with or above the cutoff
+        cutoff = keys[np.argpartition(-keys, k - 1)[:k]].min()
+        candidates = np.flatnonzero(keys >= cutoff)
+        top = candidates[np.argsort(-keys[candidates], kind="stable")][:k]
+    return symbols[top].tolist()
+
+
+def _get_top_movers_1w(columns: RankedColumns, limit: int = 5) -> list[str]:
     """Get stocks with highest 1-week performance."""
-    sorted_stocks = sorted(stocks, key=lambda s: s.data.perf_1w, reverse=True)
-    movers = [s.data.symbol for s in sorted_stocks[:limit]]
-    logger.debug(f"Top weekly movers: {movers}")
+    movers = _topk_symbols(columns.perf_1w, columns.symbol, limit)
+    logger.debug("Top weekly movers: %s", movers)
     return movers
 
 
-def _get_top_movers_1m(stocks: Sequence[RankedStock], limit: int = 5) -> list[str]:
+def _get_top_movers_1m(columns: RankedColumns, limit: int = 5) -> list[str]:
     """Get stocks with highest 1-month performance."""
-    sorted_stocks = sorted(stocks, key=lambda s: s.data.perf_1m, reverse=True)
-    movers = [s.data.symbol for s in sorted_stocks[:limit]]
-    logger.debug(f"Top monthly movers: {movers}")
+    movers = _topk_symbols(columns.perf_1m, columns.symbol, limit)
+    logger.debug("Top monthly movers: %s", movers)
     return movers
 
 
-def _get_top_movers_6m(stocks: Sequence[RankedStock], limit: int = 5) -> list[str]:
+def _get_top_movers_6m(columns: RankedColumns, limit: int = 5) -> list[str]:
     """Get stocks with highest 6-month performance."""
-    sorted_stocks = sorted(stocks, key=lambda s: s.data.perf_6m, reverse=True)
-    movers = [s.data.symbol for s in sorted_stocks[:limit]]
-    logger.debug(f"Top 6-month movers: {movers}")
+    movers = _topk_symbols(columns.perf_6m, columns.symbol, limit)
+    logger.debug("Top 6-month movers: %s", movers)
     return movers
 
 
-def _get_volume_leaders(stocks: Sequence[RankedStock], limit: int = 5) -> list[str]:
+def _get_volume_leaders(columns: RankedColumns, limit: int = 5) -> list[str]:
     """Get stocks with highest relative volume."""
-    sorted_stocks = sorted(stocks, key=lambda s: s.data.rel_volume, reverse=True)
-    leaders = [s.data.symbol for s in sorted_stocks[:limit]]
-    logger.debug(f"Volume leaders: {leaders}")
+    leaders = _topk_symbols(columns.rel_volume, columns.symbol, limit)
+    logger.debug("Volume leaders: %s", leaders)
     return leaders
 
 
-def _get_breakout_candidates(stocks: Sequence[RankedStock], limit: int = 5) -> list[str]:
+def _get_breakout_candidates(columns: RankedColumns, limit: int = 5) -> list[str]:
     """Get stocks nearest to 52-week high."""
-    def proximity(s: RankedStock) -> float:
-        if s.data.high_52w <= 0:
-            return 0
-        return s.data.price / s.data.high_52w
-    
-    sorted_stocks = sorted(stocks, key=proximity, reverse=True)
-    candidates = [s.data.symbol for s in sorted_stocks[:limit]]
-    logger.debug(f"Breakout candidates: {candidates}")
+    has_high = columns.high_52w > 0
+    proximity = np.where(has_high, columns.price / np.where(has_high, columns.high_52w, 1.0), 0.0)
+    candidates = _topk_symbols(proximity, columns.symbol, limit)
+    logger.debug("Breakout candidates: %s", candidates)
     return candidates
 
 
 def calculate_analytics(stocks: Sequence[RankedStock]) -> Analytics:
     """Calculate comprehensive analytics for ranked stocks."""
-    logger.info(f"Calculating analytics for {len(stocks)} stocks")
+    logger.info("Calculating analytics for %d stocks", len(stocks))
     
     if not stocks:
         logger.warning("No stocks to analyze")
@@ -128,26 +135,27 @@ def calculate_analytics(stocks: Sequence[RankedStock]) -> Analytics:
             volume_leaders=[], breakout_candidates=[]
         )
     
-    top_20 = [s for s in stocks if s.is_top]
-    top_movers_1w = _get_top_movers_1w(stocks)
-    top_movers_1m = _get_top_movers_1m(stocks)
-    top_movers_6m = _get_top_movers_6m(stocks)
+    # Aggregates run on the result columns rather than per-stock objects
+    columns = stocks.columns if isinstance(stocks, RankedStockTable) else RankedColumns.from_ranked(stocks)
+    top_movers_1w = _get_top_movers_1w(columns)
+    top_movers_1m = _get_top_movers_1m(columns)
+    top_movers_6m = _get_top_movers_6m(columns)
     
     analytics = Analytics(
         total_stocks=len(stocks),
-        avg_score=sum(s.total_score for s in stocks) / len(stocks),
-        avg_confidence=sum(s.confidence for s in stocks) / len(stocks),
-        top_20_avg_score=sum(s.total_score for s in top_20) / len(top_20) if top_20 else 0,
-        earnings_safe_count=sum(1 for s in stocks if s.earnings_safe),
-        trending_industries=_get_trending_industries(stocks),
-        sector_distribution=_get_sector_distribution(stocks),
+        avg_score=float(columns.total_score.mean()),
+        avg_confidence=float(columns.confidence.mean()),
+        top_20_avg_score=float(columns.total_score.mean(where=columns.is_top)) if columns.is_top.any() else 0,
+        earnings_safe_count=int(columns.earnings_safe.sum()),
+        trending_industries=_get_trending_industries(columns),
+        sector_distribution=_get_sector_distribution(columns),
         top_movers=top_movers_1w,  # Legacy field
         top_movers_1w=top_movers_1w,
         top_movers_1m=top_movers_1m,
         top_movers_6m=top_movers_6m,
-        volume_leaders=_get_volume_leaders(stocks),
-        breakout_candidates=_get_breakout_candidates(stocks),
+        volume_leaders=_get_volume_leaders(columns),
+        breakout_candidates=_get_breakout_candidates(columns),
     )
     
-    logger.info(f"Analytics: avg_score={analytics.avg_score:.1f}, top_20_avg={analytics.top_20_avg_score:.1f}")
+    logger.info("Analytics: avg_score=%.1f, top_20_avg=%.1f", analytics.avg_score, analytics.top_20_avg_score)
     return analytics
\ No newline at end of file
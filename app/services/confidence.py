@@ -1,6 +1,18 @@
 """Confidence score calculation - measures signal alignment."""
 
+from bisect import bisect_right
+
+import numpy as np
+
 from ..models import StockData, ScoreComponents
+from ..core.arrays import StockArrays
+from ..core._scoring_numba import HAS_NUMBA, calculate_confidence_numba
+
+# Points by ATH proximity tier: below 50%, then at least 50%, 70%, 85% and 95% of the ATH
+_ATH_THRESHOLDS = (0.50, 0.70, 0.85, 0.95)
+_ATH_POINTS = (0.0, 5.0, 10.0, 15.0, 20.0)
+_ATH_THRESHOLDS_ARRAY = np.array(_ATH_THRESHOLDS)
+_ATH_POINTS_ARRAY = np.array(_ATH_POINTS)
 
 
 def calculate_confidence(stock: StockData, components: ScoreComponents = None) -> float:
@@ -24,28 +36,16 @@ def calculate_confidence(stock: StockData, components: ScoreComponents = None) -
     if stock.high_52w > 0 and (stock.price / stock.high_52w) > 0.90:
         score += 10.0
     
-    # Near All-Time High (>80%) - major confidence boost
-    if stock.high_all_time > 0 and stock.high_all_time >= stock.price:
-        ath_proximity = stock.price / stock.high_all_time
-        if ath_proximity >= 0.95:
-            score += 20.0  # At or very near ATH - highest confidence
-        elif ath_proximity >= 0.85:
-            score += 15.0  # Within 15% of ATH
-        elif ath_proximity >= 0.70:
-            score += 10.0  # Within 30% of ATH
-        elif ath_proximity >= 0.50:
-            score += 5.0   # Within 50% of ATH
-        # Below 50% of ATH = no confidence points
-    elif stock.high_all_time > 0 and stock.price > stock.high_all_time:
-        # Making new ATH - maximum confidence!
-        score += 20.0
+    # Near All-Time High - major confidence boost; making a new ATH earns the top tier
+    if stock.high_all_time > 0:
+        score += _ATH_POINTS[bisect_right(_ATH_THRESHOLDS, stock.price / stock.high_all_time)]
     
     # Volume confirmation (rel_vol > 1.2)
     if stock.rel_volume > 1.2:
         score += 10.0
     
     # All timeframes positive momentum
-    if all([stock.perf_1w > 0, stock.perf_1m > 0, stock.perf_3m > 0, stock.perf_6m > 0]):
+    if stock.perf_1w > 0 and stock.perf_1m > 0 and stock.perf_3m > 0 and stock.perf_6m > 0:
         score += 15.0
     
     # Low volatility (<5%)
@@ -59,4 +59,42 @@ def calculate_confidence(stock: StockData, components: ScoreComponents = None) -
         momentum_contribution = min((total_momentum / 60) * 15, 15.0)
         score += momentum_contribution
     
-    return min(score, 100.0)
\ No newline at end of file
+    return min(score, 100.0)
+
+
+def calculate_confidence_bulk(arrays: StockArrays, components: np.ndarray) -> np.ndarray:
+    """Calculate confidence scores for all stocks.
+    
+    Args:
+        arrays: Stock columns
+        components: (N, 5) score components in the same stock order, for momentum strength
+    
+    Uses the compiled kernel when numba is installed.
+    """
+    if HAS_NUMBA:
+        return calculate_confidence_numba(arrays, components)
+    return _calculate_confidence_numpy(arrays, components)
+
+
+def _calculate_confidence_numpy(arrays: StockArrays, components: np.ndarray) -> np.ndarray:
+    """Vectorized calculate_confidence over all stocks.
+    
+    Missing highs are treated as infinite so their proximity is 0, and a price
+    above the all-time high lands in the top tier like the new-ATH branch.
+    """
+    price = arrays.price
+    high_52w = np.where(arrays.high_52w > 0, arrays.high_52w, np.inf)
+    ath_proximity = price / np.where(arrays.high_all_time > 0, arrays.high_all_time, np.inf)
+    all_positive = (arrays.perf_1w > 0) & (arrays.perf_1m > 0) & (arrays.perf_3m > 0) & (arrays.perf_6m > 0)
+    
+    score = (
+        15.0 * ((arrays.sma_50 > 0) & (price > arrays.sma_50))
+        + 10.0 * ((arrays.sma_200 > 0) & (price > arrays.sma_200))
+        + 10.0 * (price / high_52w > 0.90)
+        + _ATH_POINTS_ARRAY[np.searchsorted(_ATH_THRESHOLDS_ARRAY, ath_proximity, side="right")]
+        + 10.0 * (arrays.rel_volume > 1.2)
+        + 15.0 * all_positive
+        + 5.0 * (arrays.volatility_1m < 5)
+    )
+    score += np.minimum((components[:, 0] + components[:, 1]) / 60 * 15, 15.0)
+    return np.minimum(score, 100.0)
@@ -2,14 +2,21 @@
 
 import io
 import logging
-from datetime import datetime
-from typing import Optional
+from dataclasses import fields
 import pandas as pd
 
 from ..models import StockData
 
 logger = logging.getLogger(__name__)
 
+# Prefer Arrow's multithreaded C++ CSV reader when pyarrow is installed
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+    CSV_ENGINE = "pyarrow"
+except ImportError:  # pragma: no cover - depends on the environment
+    CSV_ENGINE = "c"
+
 
 # Column name mappings - configurable
 COLUMN_MAP = {
@@ -42,55 +49,59 @@ COLUMN_MAP = {
 }
 
 
-def _safe_float(value, default: float = 0.0) -> float:
-    """Safely convert value to float."""
-    try:
-        if pd.isna(value):
-            return default
-        return float(value)
-    except (ValueError, TypeError):
-        return default
+# StockData fields that are not floats, and floats that do not default to 0
+_STRING_FIELDS = frozenset({"symbol", "description", "sector", "industry", "indexes"})
+_DATE_FIELDS = frozenset({"earnings_date"})
+_FLOAT_DEFAULTS = {"beta": 1.0, "rel_volume": 1.0}
+# Columns read as raw strings, so every engine hands _column the same text
+_TEXT_COLUMNS = frozenset(COLUMN_MAP[key] for key in _STRING_FIELDS | _DATE_FIELDS)
 
 
-def _parse_date(value) -> Optional[datetime]:
-    """Parse date string to datetime."""
-    if pd.isna(value) or not value:
-        return None
-    try:
-        return datetime.strptime(str(value), "%Y-%m-%d").date()
-    except ValueError:
-        return None
+def _column(df: pd.DataFrame, key: str) -> list:
+    """Convert one CSV column to a list of StockData field values.
+    
+    Missing columns and unparseable cells fall back to the field default:
+    "" for strings, None for dates, and 0.0 (or the _FLOAT_DEFAULTS entry) for numbers.
+    """
+    col = COLUMN_MAP[key]
+    if key in _STRING_FIELDS:
+        if col not in df.columns:
+            return [""] * len(df)
+        return df[col].fillna("").astype(str).tolist()
+    if key in _DATE_FIELDS:
+        if col not in df.columns:
+            return [None] * len(df)
+        # ISO dates take pandas' C fast path; cache parses each distinct date string once
+        dates = pd.to_datetime(df[col], errors="coerce", format="%Y-%m-%d", cache=True)
+        return dates.dt.date.astype(object).where(dates.notna(), None).tolist()
+    default = _FLOAT_DEFAULTS.get(key, 0.0)
+    if col not in df.columns:
+        return [default] * len(df)
+    return pd.to_numeric(df[col], errors="coerce").fillna(default).astype(float).tolist()
 
 
-def _row_to_stock(row: pd.Series) -> StockData:
-    """Convert a DataFrame row to StockData model."""
-    return StockData(
-        symbol=str(row.get(COLUMN_MAP["symbol"], "")),
-        description=str(row.get(COLUMN_MAP["description"], "")),
-        sector=str(row.get(COLUMN_MAP["sector"], "")),
-        industry=str(row.get(COLUMN_MAP["industry"], "")),
-        price=_safe_float(row.get(COLUMN_MAP["price"])),
-        market_cap=_safe_float(row.get(COLUMN_MAP["market_cap"])),
-        beta=_safe_float(row.get(COLUMN_MAP["beta"]), 1.0),
-        volume_1d=_safe_float(row.get(COLUMN_MAP["volume_1d"])),
-        volume_1w=_safe_float(row.get(COLUMN_MAP["volume_1w"])),
-        avg_volume_90d=_safe_float(row.get(COLUMN_MAP["avg_volume_90d"])),
-        earnings_date=_parse_date(row.get(COLUMN_MAP["earnings_date"])),
-        change_1d=_safe_float(row.get(COLUMN_MAP["change_1d"])),
-        perf_1w=_safe_float(row.get(COLUMN_MAP["perf_1w"])),
-        perf_1m=_safe_float(row.get(COLUMN_MAP["perf_1m"])),
-        perf_3m=_safe_float(row.get(COLUMN_MAP["perf_3m"])),
-        perf_6m=_safe_float(row.get(COLUMN_MAP["perf_6m"])),
-        perf_ytd=_safe_float(row.get(COLUMN_MAP["perf_ytd"])),
-        perf_1y=_safe_float(row.get(COLUMN_MAP["perf_1y"])),
-        volatility_1m=_safe_float(row.get(COLUMN_MAP["volatility_1m"])),
-        high_52w=_safe_float(row.get(COLUMN_MAP["high_52w"])),
-        high_all_time=_safe_float(row.get(COLUMN_MAP["high_all_time"])),
-        sma_50=_safe_float(row.get(COLUMN_MAP["sma_50"])),
-        sma_200=_safe_float(row.get(COLUMN_MAP["sma_200"])),
-        rel_volume=_safe_float(row.get(COLUMN_MAP["rel_volume"]), 1.0),
-        volume_change=_safe_float(row.get(COLUMN_MAP["volume_change"])),
-        indexes=str(row.get(COLUMN_MAP["indexes"], "")),
+def _read_columns(content: bytes | str, usecols: list[str]) -> pd.DataFrame:
+    """Read the used columns, keeping text and date columns as the raw strings.
+    
+    pandas' pyarrow engine infers types before applying dtype= (turning
+    "2026-10-17 08:30:00" into a timestamp, and failing the cast on integer
+    columns with blanks), so with pyarrow the file is read through pyarrow.csv
+    with explicit string column types instead.
+    """
+    text_cols = [col for col in usecols if col in _TEXT_COLUMNS]
+    if CSV_ENGINE == "pyarrow":
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        table = pa_csv.read_csv(pa.BufferReader(data), convert_options=pa_csv.ConvertOptions(
+            include_columns=usecols,
+            column_types=dict.fromkeys(text_cols, pa.string()),
+            strings_can_be_null=True,
+        ))
+        return table.to_pandas()
+    # Let the CSV engine decode bytes itself rather than building a decoded copy first
+    buffer_type = io.BytesIO if isinstance(content, bytes) else io.StringIO
+    return pd.read_csv(
+        buffer_type(content), engine=CSV_ENGINE, encoding="utf-8", usecols=usecols,
+        dtype=dict.fromkeys(text_cols, str),
     )
 
 
@@ -98,13 +109,13 @@ def parse_csv_file(content: bytes | str) -> list[StockData]:
     """Parse CSV content and return list of StockData objects."""
     logger.info("Parsing CSV content...")
     
-    if isinstance(content, bytes):
-        content = content.decode("utf-8")
-        logger.debug("Decoded bytes to UTF-8 string")
-    
-    df = pd.read_csv(io.StringIO(content))
-    logger.info(f"CSV has {len(df)} rows and {len(df.columns)} columns")
-    logger.debug(f"Columns found: {list(df.columns)}")
+    # Read the header first so only mapped columns are parsed
+    buffer_type = io.BytesIO if isinstance(content, bytes) else io.StringIO
+    header = pd.read_csv(buffer_type(content), nrows=0, encoding="utf-8").columns
+    usecols = [col for col in COLUMN_MAP.values() if col in header]
+    df = _read_columns(content, usecols)
+    logger.info("CSV has %d rows and %d columns (%d used)", len(df), len(header), len(usecols))
+    logger.debug("Columns found: %s", list(header))
     
     # Check for required columns
     missing_cols = []
@@ -113,28 +124,17 @@ def parse_csv_file(content: bytes | str) -> list[StockData]:
             missing_cols.append(col)
     
     if missing_cols:
-        logger.warning(f"Missing columns: {missing_cols[:5]}{'...' if len(missing_cols) > 5 else ''}")
-    
-    stocks = []
-    errors = 0
-    for idx, row in df.iterrows():
-        try:
-            stock = _row_to_stock(row)
-            if stock.symbol:  # Skip rows without symbol
-                stocks.append(stock)
-        except Exception as e:
-            errors += 1
-            if errors <= 3:
-                logger.warning(f"Error parsing row {idx}: {e}")
+        logger.warning("Missing columns: %s%s", missing_cols[:5], "..." if len(missing_cols) > 5 else "")
     
-    if errors > 3:
-        logger.warning(f"... and {errors - 3} more parsing errors")
+    # Convert column by column, then build the rows in StockData field order
+    columns = [_column(df, f.name) for f in fields(StockData) if f.init]
+    stocks = [StockData(*values) for values in zip(*columns) if values[0]]  # Skip rows without symbol
     
-    logger.info(f"Successfully parsed {len(stocks)} stocks ({errors} errors)")
+    logger.info("Successfully parsed %d stocks (%d rows without symbol)", len(stocks), len(df) - len(stocks))
     
     # Log sample data
     if stocks:
         sample = stocks[0]
-        logger.debug(f"Sample stock: {sample.symbol} - {sample.description} - Price: ${sample.price:.2f}")
+        logger.debug("Sample stock: %s - %s - Price: $%.2f", sample.symbol, sample.description, sample.price)
     
     return stocks
\ No newline at end of file
@@ -1,11 +1,18 @@
 """Market overview service - fetches major index ETF data from Yahoo Finance."""
 
+import datetime
 import logging
 import json
+import time
+from bisect import bisect_left
 from dataclasses import dataclass
+from operator import itemgetter
 from typing import Optional
 import urllib.request
 import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+
+from ..config import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -34,19 +41,26 @@ class MarketETF:
     change_1y: float  # 1 Year change %
 
 
+def _fetch_chart(symbol: str, range_: str) -> dict:
+    """Fetch one daily chart range for a symbol from Yahoo Finance."""
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+    }
+    url = f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}?interval=1d&range={range_}"
+    req = urllib.request.Request(url, headers=headers)
+    with urllib.request.urlopen(req, timeout=10) as response:
+        return json.loads(response.read().decode('utf-8'))
+
+
 def _fetch_yahoo_finance_data(symbol: str) -> Optional[dict]:
     """Fetch ETF data from Yahoo Finance API with multiple time periods."""
+    logger.info("Fetching %s data from Yahoo Finance...", symbol)
     
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        }
-        
-        # Fetch current price and day change
-        url_1d = f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}?interval=1d&range=1d"
-        req = urllib.request.Request(url_1d, headers=headers)
-        with urllib.request.urlopen(req, timeout=10) as response:
-            data = json.loads(response.read().decode('utf-8'))
+        # Fetch current price and day change, then 1 year data for all periods.
+        # Symbols are already fetched concurrently by get_market_overview.
+        data = _fetch_chart(symbol, "1d")
+        data_1y = _fetch_chart(symbol, "1y")
         
         result = data['chart']['result'][0]
         meta = result['meta']
@@ -55,18 +69,12 @@ def _fetch_yahoo_finance_data(symbol: str) -> Optional[dict]:
         prev_close = meta.get('chartPreviousClose', meta.get('previousClose', 0))
         change_1d = ((price - prev_close) / prev_close * 100) if prev_close else 0
         
-        # Fetch 1 year data to calculate all periods
-        url_1y = f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}?interval=1d&range=1y"
-        req = urllib.request.Request(url_1y, headers=headers)
-        with urllib.request.urlopen(req, timeout=10) as response:
-            data_1y = json.loads(response.read().decode('utf-8'))
-        
         result_1y = data_1y['chart']['result'][0]
-        closes = result_1y.get('indicators', {}).get('quote', [{}])[0].get('close', [])
+        raw_closes = result_1y.get('indicators', {}).get('quote', [{}])[0].get('close', [])
         timestamps = result_1y.get('timestamp', [])
         
         # Filter out None values
-        closes = [c for c in closes if c is not None]
+        closes = [c for c in raw_closes if c is not None]
         
         if len(closes) > 0:
             current = closes[-1]
@@ -80,17 +88,12 @@ def _fetch_yahoo_finance_data(symbol: str) -> Optional[dict]:
             change_1y = ((current - closes[0]) / closes[0] * 100) if len(closes) > 0 else 0
             
             # Calculate YTD (from first trading day of the year)
-            # Find the first close of the current year
-            import datetime
-            current_year = datetime.datetime.now().year
-            ytd_start_price = closes[0]  # Default to start of data
-            
-            for i, ts in enumerate(timestamps):
-                if ts:
-                    dt = datetime.datetime.fromtimestamp(ts)
-                    if dt.year == current_year:
-                        ytd_start_price = closes[i] if i < len(closes) and closes[i] else closes[0]
-                        break
+            # Timestamps are ascending, so the first close of the current year is found by bisection.
+            # Yahoo can return None for either series; drop those points, keeping the pairs aligned.
+            points = [(ts, c) for ts, c in zip(timestamps, raw_closes) if ts and c]
+            jan1 = datetime.datetime(datetime.datetime.now().year, 1, 1).timestamp()
+            i = bisect_left(points, jan1, key=itemgetter(0))
+            ytd_start_price = points[i][1] if i < len(points) else closes[0]
             
             change_ytd = ((current - ytd_start_price) / ytd_start_price * 100) if ytd_start_price else 0
         else:
@@ -108,28 +111,50 @@ def _fetch_yahoo_finance_data(symbol: str) -> Optional[dict]:
         }
         
     except urllib.error.URLError as e:
-        logger.error(f"Network error fetching {symbol}: {e}")
+        logger.error("Network error fetching %s: %s", symbol, e)
         return None
     except (json.JSONDecodeError, KeyError, IndexError) as e:
-        logger.error(f"Error parsing {symbol} data: {e}")
+        logger.error("Error parsing %s data: %s", symbol, e)
         return None
     except Exception as e:
-        logger.error(f"Error fetching {symbol}: {e}")
+        logger.error("Error fetching %s: %s", symbol, e)
         return None
 
 
+# Successful fetches by symbol, with the cache window they were made in
+_fetch_cache: dict[str, tuple[int, dict]] = {}
+
+
+def _get_etf_data(symbol: str) -> Optional[dict]:
+    """Fetch ETF data, reusing a successful fetch from the current cache window."""
+    window = get_settings().market_data_cache_seconds
+    if window <= 0:
+        return _fetch_yahoo_finance_data(symbol)
+    
+    bucket = int(time.time() // window)
+    cached = _fetch_cache.get(symbol)
+    if cached is not None and cached[0] == bucket:
+        logger.debug("Using cached %s data", symbol)
+        return cached[1]
+    
+    data = _fetch_yahoo_finance_data(symbol)
+    if data is not None:  # Failed fetches are retried on the next call
+        _fetch_cache[symbol] = (bucket, data)
+    return data
+
+
 def get_market_overview(stocks=None) -> list[MarketETF]:
     """Fetch market ETF data from Yahoo Finance.
     
     Args:
         stocks: Unused, kept for API compatibility
     """
-    market_data = []
+    # Fetches are network-bound, so all symbols are fetched concurrently
+    with ThreadPoolExecutor(max_workers=len(MARKET_ETFS)) as executor:
+        results = list(executor.map(_get_etf_data, MARKET_ETFS))
     
-    for symbol in MARKET_ETFS:
-        logger.info(f"Fetching {symbol} data from Yahoo Finance...")
-        data = _fetch_yahoo_finance_data(symbol)
-        
+    market_data = []
+    for symbol, data in zip(MARKET_ETFS, results):
         if data:
             market_data.append(MarketETF(
                 symbol=symbol,
@@ -143,8 +168,11 @@ def get_market_overview(stocks=None) -> list[MarketETF]:
                 change_ytd=data['change_ytd'],
                 change_1y=data['change_1y'],
             ))
-            logger.info(f"Found {symbol}: ${data['price']:.2f} (1D: {data['change_1d']:+.2f}%, YTD: {data['change_ytd']:+.2f}%)")
+            logger.info(
+                "Found %s: $%.2f (1D: %+.2f%%, YTD: %+.2f%%)",
+                symbol, data['price'], data['change_1d'], data['change_ytd'],
+            )
         else:
-            logger.warning(f"Could not fetch {symbol} data")
+            logger.warning("Could not fetch %s data", symbol)
     
     return market_data
\ No newline at end of file
@@ -1,80 +1,82 @@
 """Stock ranking service - orchestrates scoring and ranking."""
 
 import logging
-from datetime import date, timedelta
+from datetime import date
 from typing import Sequence
 
+import numpy as np
+
 from ..config import get_settings
-from ..models import StockData, RankedStock
-from ..core.scoring import calculate_components, calculate_total_score
-from .confidence import calculate_confidence
+from ..models import StockData, RankedColumns, RankedStockTable
+from ..core.arrays import build_stock_arrays
+from ..core.constants import ScoringConstants
+from ..core.scoring import score_stock_arrays
+from .confidence import calculate_confidence_bulk
 
 logger = logging.getLogger(__name__)
 
 
-def _is_earnings_safe(stock: StockData, days: int) -> bool:
-    """Check if stock is safe from earnings announcement."""
-    if stock.earnings_date is None:
-        return True
-    today = date.today()
-    delta = abs((stock.earnings_date - today).days)
-    return delta > days
+# Ordinal for stocks without an earnings date - far enough from any real date to count as safe
+_NO_EARNINGS_ORDINAL = np.iinfo(np.int32).max
 
 
-def _create_ranked_stock(stock: StockData, rank: int, top_count: int, earnings_days: int) -> RankedStock:
-    """Create a RankedStock from StockData with all calculations."""
-    components = calculate_components(stock)
-    total = calculate_total_score(components)
-    confidence = calculate_confidence(stock)
-    earnings_safe = _is_earnings_safe(stock, earnings_days)
-    
-    return RankedStock(
-        data=stock,
-        components=components,
-        total_score=total,
-        confidence=confidence,
-        rank=rank,
-        is_top=rank <= top_count,
-        earnings_safe=earnings_safe,
+def _earnings_safe_mask(stocks: Sequence[StockData], days: int, today: date) -> np.ndarray:
+    """Check which stocks are safe from an earnings announcement, as a boolean array."""
+    ordinals = np.fromiter(
+        (_NO_EARNINGS_ORDINAL if stock.earnings_date is None else stock.earnings_date.toordinal()
+         for stock in stocks),
+        dtype=np.int64, count=len(stocks),
     )
+    # Unsafe window as an inclusive ordinal range around today
+    first_unsafe = today.toordinal() - days
+    last_unsafe = today.toordinal() + days
+    return (ordinals < first_unsafe) | (ordinals > last_unsafe)
 
 
-def rank_stocks(stocks: Sequence[StockData]) -> list[RankedStock]:
-    """Score and rank all stocks, returning sorted list."""
+def rank_stocks(stocks: Sequence[StockData]) -> RankedStockTable:
+    """Score and rank all stocks, returning a rank-ordered table."""
     settings = get_settings()
-    logger.info(f"Ranking {len(stocks)} stocks...")
+    logger.info("Ranking %d stocks...", len(stocks))
     
-    # Calculate scores for all stocks
-    scored = []
-    for i, stock in enumerate(stocks):
-        components = calculate_components(stock)
-        total = calculate_total_score(components)
-        scored.append((stock, components, total))
-        
-        if (i + 1) % 50 == 0:
-            logger.debug(f"Scored {i + 1}/{len(stocks)} stocks")
+    # Calculate scores for all stocks in one batch
+    constants = ScoringConstants.from_settings(settings)
+    arrays = build_stock_arrays(stocks)
+    components, totals = score_stock_arrays(arrays, constants)
+    confidence = calculate_confidence_bulk(arrays, components)
+    logger.debug("Scored %d stocks", len(stocks))
     
-    # Sort by total score descending
-    scored.sort(key=lambda x: x[2], reverse=True)
-    logger.info(f"Sorted stocks by score. Top score: {scored[0][2]:.1f}, Bottom: {scored[-1][2]:.1f}")
+    # Sort by total score descending; a stable sort keeps input order for ties
+    order = np.argsort(-totals, kind="stable")
+    ranked_stocks = [stocks[i] for i in order.tolist()]
+    components = components[order]
+    totals = totals[order]
+    confidence = confidence[order]
+    logger.info("Sorted stocks by score. Top score: %.1f, Bottom: %.1f", totals[0], totals[-1])
     
-    # Create RankedStock objects with proper ranks
-    ranked = [
-        RankedStock(
-            data=stock,
-            components=components,
-            total_score=total,
-            confidence=calculate_confidence(stock, components),
-            rank=idx + 1,
-            is_top=(idx + 1) <= settings.top_stocks_count,
-            earnings_safe=_is_earnings_safe(stock, settings.earnings_exclusion_days),
-        )
-        for idx, (stock, components, total) in enumerate(scored)
-    ]
+    earnings_safe = _earnings_safe_mask(ranked_stocks, settings.earnings_exclusion_days, date.today())
+    
+    # RankedStock objects are only built when a row is accessed
+    ranked = RankedStockTable(ranked_stocks, RankedColumns(
+        components=components,
+        total_score=totals,
+        confidence=confidence,
+        is_top=np.arange(len(ranked_stocks)) < settings.top_stocks_count,
+        earnings_safe=earnings_safe,
+        symbol=np.array([stock.symbol for stock in ranked_stocks], dtype=object),
+        industry=np.array([stock.industry for stock in ranked_stocks], dtype=object),
+        sector=np.array([stock.sector for stock in ranked_stocks], dtype=object),
+        price=arrays.price[order],
+        high_52w=arrays.high_52w[order],
+        perf_1w=arrays.perf_1w[order],
+        perf_1m=arrays.perf_1m[order],
+        perf_6m=arrays.perf_6m[order],
+        rel_volume=arrays.rel_volume[order],
+    ))
     
-    # Log top 5 stocks
-    logger.info("Top 5 stocks:")
-    for s in ranked[:5]:
-        logger.info(f"  #{s.rank} {s.data.symbol}: {s.total_score:.1f} (conf: {s.confidence:.0f}%)")
+    # Log top 5 stocks (skip materializing them when INFO is off)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Top 5 stocks:")
+        for s in ranked.top(5):
+            logger.info("  #%d %s: %.1f (conf: %.0f%%)", s.rank, s.data.symbol, s.total_score, s.confidence)
     
-    return ranked
\ No newline at end of file
+    return ranked
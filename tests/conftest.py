@@ -0,0 +1,54 @@
+"""Shared test fixtures."""
+import numpy as np
+import pytest
+from app.models import StockData
+
+
+def _random_stocks(count, seed, industries=(("Technology", "Software"),)):
+    """Randomized stocks spanning the score tiers, including missing data.
+    
+    Each stock gets a (sector, industry) pair drawn from industries.
+    """
+    rng = np.random.default_rng(seed)
+    price = rng.uniform(5, 500, count)
+    
+    def maybe_missing(values):
+        return np.where(rng.random(count) < 0.15, 0.0, values)
+    
+    columns = {
+        "price": price,
+        "market_cap": rng.choice([5e8, 3e9, 1.5e10, 3e10, 7e10, 2e11], count),
+        "beta": rng.uniform(0, 3, count),
+        "volume_1d": rng.uniform(0, 2e7, count),
+        "volume_1w": rng.uniform(0, 1e8, count),
+        "avg_volume_90d": maybe_missing(rng.uniform(1e5, 2e7, count)),
+        "change_1d": rng.uniform(-5, 5, count),
+        "perf_1w": rng.uniform(-10, 10, count),
+        "perf_1m": rng.uniform(-20, 20, count),
+        "perf_3m": rng.uniform(-30, 30, count),
+        "perf_6m": rng.uniform(-40, 60, count),
+        "perf_ytd": rng.uniform(-30, 50, count),
+        "perf_1y": rng.uniform(-50, 100, count),
+        "volatility_1m": rng.uniform(0, 10, count),
+        "high_52w": maybe_missing(price * rng.uniform(1, 1.6, count)),
+        "high_all_time": maybe_missing(price * rng.uniform(0.9, 4, count)),
+        "sma_50": maybe_missing(price * rng.uniform(0.8, 1.2, count)),
+        "sma_200": maybe_missing(price * rng.uniform(0.7, 1.3, count)),
+        "rel_volume": rng.uniform(0.3, 3, count),
+        "volume_change": rng.uniform(-50, 50, count),
+    }
+    groups = rng.integers(len(industries), size=count)
+    return [
+        StockData(
+            symbol=f"S{i:02d}", description=f"Stock {i}", sector=industries[groups[i]][0],
+            industry=industries[groups[i]][1], earnings_date=None,
+            **{name: float(values[i]) for name, values in columns.items()},
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture(scope="session")
+def random_stocks():
+    """Factory for randomized stock universes: random_stocks(count, seed, industries)."""
+    return _random_stocks
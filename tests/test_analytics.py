@@ -0,0 +1,53 @@
+"""Tests for analytics."""
+import json
+import pytest
+from dataclasses import asdict, replace
+from app.models import RankedStockTable
+from app.services.analytics import calculate_analytics
+from app.services.stock_ranker import rank_stocks
+
+
+@pytest.fixture(scope="module")
+def ranked(random_stocks):
+    """Ranked table of 40 randomized stocks across several sectors and industries."""
+    industries = [("Technology", "Software"), ("Technology", "Semiconductors"), ("Health Care", "Biotech"), ("Energy", "Oil")]
+    stocks = random_stocks(40, seed=7, industries=industries)
+    # The last stock gets an industry of its own
+    stocks[-1] = replace(stocks[-1], sector="Utilities", industry="Water")
+    return rank_stocks(stocks)
+
+
+class TestCalculateAnalytics:
+    """Test analytics over ranked stocks."""
+    
+    def test_table_matches_list(self, ranked):
+        """The columnar table path should give the same analytics as a plain list of RankedStock."""
+        assert isinstance(ranked, RankedStockTable)
+        assert calculate_analytics(ranked) == calculate_analytics(list(ranked))
+    
+    def test_trending_industries_skip_single_stock_industries(self, ranked):
+        """Industries with one stock are left out; the rest name their best-ranked stock."""
+        analytics = calculate_analytics(ranked)
+        
+        names = [industry.name for industry in analytics.trending_industries]
+        assert "Water" not in names
+        assert analytics.sector_distribution["Utilities"] == 1
+        for industry in analytics.trending_industries:
+            best = next(s for s in ranked if s.data.industry == industry.name)
+            assert industry.top_stock == best.data.symbol
+            assert industry.sector == best.data.sector
+    
+    def test_asdict_json_round_trip(self, ranked):
+        """Analytics converted with asdict should serialize to JSON with sector names as keys."""
+        analytics = calculate_analytics(ranked)
+        
+        data = json.loads(json.dumps(asdict(analytics)))
+        assert data["sector_distribution"] == analytics.sector_distribution
+        assert type(analytics.sector_distribution) is dict
+    
+    def test_empty(self):
+        """No stocks gives zeroed analytics."""
+        analytics = calculate_analytics([])
+        
+        assert analytics.total_stocks == 0
+        assert analytics.trending_industries == []
@@ -0,0 +1,71 @@
+"""Tests for CSV parsing."""
+import pytest
+from datetime import date
+from app.services import csv_parser
+from app.services.csv_parser import parse_csv_file
+
+
+@pytest.fixture(params=[
+    "c",
+    pytest.param("pyarrow", marks=pytest.mark.skipif(csv_parser.CSV_ENGINE != "pyarrow", reason="pyarrow not installed")),
+])
+def engine(request, monkeypatch):
+    """Run the test under each CSV engine."""
+    monkeypatch.setattr(csv_parser, "CSV_ENGINE", request.param)
+    return request.param
+
+
+class TestParseCsvFile:
+    """Test CSV content to StockData conversion."""
+    
+    def test_blank_cell_in_integer_column(self):
+        """A blank cell in an otherwise integer column falls back to the default."""
+        content = b"Symbol,Description,Price,Volume 1 day\nAAA,Alpha,10.5,1200000\nBBB,Beta,20.25,\n"
+        stocks = parse_csv_file(content)
+        
+        assert [s.symbol for s in stocks] == ["AAA", "BBB"]
+        assert stocks[0].volume_1d == 1200000.0
+        assert stocks[1].volume_1d == 0.0
+        assert stocks[1].price == 20.25
+    
+    def test_defaults_for_missing_and_invalid_values(self):
+        """Missing columns, bad numbers, bad dates and blank text get field defaults."""
+        content = (
+            "Symbol,Sector,Price,Beta 1 year,Upcoming earnings date\n"
+            "AAA,,abc,,2026-10-17\n"
+            "BBB,Tech,5,1.2,bad\n"
+        )
+        stocks = parse_csv_file(content)
+        
+        assert stocks[0].sector == ""
+        assert stocks[0].price == 0.0
+        assert stocks[0].beta == 1.0
+        assert stocks[0].rel_volume == 1.0
+        assert stocks[0].earnings_date == date(2026, 10, 17)
+        assert stocks[1].earnings_date is None
+        assert stocks[1].description == ""
+    
+    def test_rows_without_symbol_are_skipped(self):
+        """Rows with an empty Symbol are dropped."""
+        stocks = parse_csv_file("Symbol,Price\nAAA,1\n,2\n")
+        assert [s.symbol for s in stocks] == ["AAA"]
+    
+    def test_earnings_dates_are_engine_independent(self, engine):
+        """Only plain ISO dates parse; timestamps and text fall back to None under every engine."""
+        content = (
+            b"Symbol,Upcoming earnings date,Volume 1 day,Index\n"
+            b"AAA,2026-10-17 08:30:00,1,NA\n"
+            b"BBB,2026-10-18,,S&P 500\n"
+            b"CCC,,3,\n"
+        )
+        stocks = parse_csv_file(content)
+        
+        assert [s.earnings_date for s in stocks] == [None, date(2026, 10, 18), None]
+        assert [s.indexes for s in stocks] == ["", "S&P 500", ""]
+    
+    def test_text_columns_keep_raw_strings(self, engine):
+        """Numeric-looking text stays as written rather than going through type inference."""
+        stocks = parse_csv_file("Symbol,Description,Price\n0012,1.50,2\n")
+        
+        assert stocks[0].symbol == "0012"
+        assert stocks[0].description == "1.50"
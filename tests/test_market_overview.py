@@ -0,0 +1,52 @@
+"""Tests for the market overview service."""
+import datetime
+import pytest
+from app.services import market_overview
+
+
+def _charts(timestamps, closes):
+    """Fake _fetch_chart returning the given 1y series and a flat 1d quote."""
+    def fetch_chart(symbol, range_):
+        if range_ == "1d":
+            return {"chart": {"result": [{"meta": {"regularMarketPrice": closes[-1], "chartPreviousClose": closes[-1]}}]}}
+        return {"chart": {"result": [{"timestamp": timestamps, "indicators": {"quote": [{"close": closes}]}}]}}
+    return fetch_chart
+
+
+class TestFetchYahooFinanceData:
+    """Test chart data to ETF returns conversion."""
+    
+    @pytest.fixture
+    def days(self):
+        """Timestamps for the last trading day of last year and the first days of this year."""
+        year = datetime.datetime.now().year
+        return [
+            datetime.datetime(year - 1, 12, 30).timestamp(),
+            datetime.datetime(year, 1, 2).timestamp(),
+            datetime.datetime(year, 1, 3).timestamp(),
+        ]
+    
+    def test_ytd_from_first_close_of_the_year(self, monkeypatch, days):
+        """YTD is measured from the first close on or after Jan 1."""
+        monkeypatch.setattr(market_overview, "_fetch_chart", _charts(days, [100.0, 110.0, 121.0]))
+        data = market_overview._fetch_yahoo_finance_data("SPY")
+        
+        assert data["change_ytd"] == pytest.approx(10.0)
+        assert data["change_1y"] == pytest.approx(21.0)
+    
+    def test_none_timestamp_is_skipped(self, monkeypatch, days):
+        """A None timestamp and its close are dropped instead of failing the whole ETF."""
+        timestamps = [days[0], None, days[1], days[2]]
+        monkeypatch.setattr(market_overview, "_fetch_chart", _charts(timestamps, [100.0, 105.0, 110.0, 121.0]))
+        data = market_overview._fetch_yahoo_finance_data("SPY")
+        
+        assert data is not None
+        assert data["change_ytd"] == pytest.approx(10.0)
+    
+    def test_none_close_is_skipped(self, monkeypatch, days):
+        """A missing first close of the year falls through to the next one."""
+        timestamps = [days[0], days[1], days[2], days[2] + 86400]
+        monkeypatch.setattr(market_overview, "_fetch_chart", _charts(timestamps, [100.0, None, 110.0, 121.0]))
+        data = market_overview._fetch_yahoo_finance_data("SPY")
+        
+        assert data["change_ytd"] == pytest.approx(10.0)
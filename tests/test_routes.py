@@ -0,0 +1,138 @@
+"""Tests for the API routes."""
+import csv
+import io
+import re
+import pytest
+from dataclasses import replace
+from fastapi.testclient import TestClient
+from app.api import routes
+from app.main import app
+from app.services.csv_parser import COLUMN_MAP
+
+INDUSTRIES = [("Technology", "Software"), ("Technology", "Semiconductors"), ("Health Care", "Biotech")]
+
+
+def _to_csv(stocks) -> bytes:
+    """Write stocks as an upload CSV with the mapped column headers."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(COLUMN_MAP.values())
+    for stock in stocks:
+        writer.writerow("" if getattr(stock, key) is None else getattr(stock, key) for key in COLUMN_MAP)
+    return buffer.getvalue().encode("utf-8")
+
+
+def _symbols(response) -> list[str]:
+    """Symbols in table order (each row links its symbol once per layout)."""
+    return list(dict.fromkeys(re.findall(r'chart/\?symbol=([^"&]+)"', response.text)))
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Test client with the market overview stubbed out and the snapshot restored afterwards."""
+    monkeypatch.setattr(routes, "_snapshot", routes._snapshot)
+    monkeypatch.setattr(routes, "get_market_overview", lambda *args, **kwargs: [])
+    return TestClient(app)
+
+
+@pytest.fixture
+def uploaded(client, random_stocks):
+    """Upload 30 stocks and return the ranked stocks in rank order."""
+    stocks = random_stocks(30, seed=3, industries=INDUSTRIES)
+    stocks[4] = replace(stocks[4], description="Acme Widgets")
+    response = client.post("/upload", files={"file": ("stocks.csv", _to_csv(stocks), "text/csv")})
+    assert response.status_code == 200
+    return list(routes._snapshot.stocks)
+
+
+class TestGetStocks:
+    """Test filtering and sorting of the stock table."""
+    
+    def test_rank_order(self, client, uploaded):
+        """No filters returns every stock in rank order."""
+        assert _symbols(client.get("/stocks")) == [s.data.symbol for s in uploaded]
+    
+    def test_industry(self, client, uploaded):
+        """Industry filter keeps rank order."""
+        expected = [s.data.symbol for s in uploaded if s.data.industry == "Semiconductors"]
+        assert expected
+        assert _symbols(client.get("/stocks", params={"industry": "Semiconductors"})) == expected
+    
+    def test_sector(self, client, uploaded):
+        """Sector filter keeps rank order."""
+        expected = [s.data.symbol for s in uploaded if s.data.sector == "Technology"]
+        assert _symbols(client.get("/stocks", params={"sector": "Technology"})) == expected
+    
+    def test_industry_and_sector(self, client, uploaded):
+        """An industry outside the requested sector matches nothing."""
+        response = client.get("/stocks", params={"industry": "Biotech", "sector": "Technology"})
+        assert _symbols(response) == []
+    
+    def test_search(self, client, uploaded):
+        """Search matches symbol or description, case-insensitively."""
+        assert _symbols(client.get("/stocks", params={"search": "acme"})) == ["S04"]
+        expected = [s.data.symbol for s in uploaded if "s1" in s.data.symbol.lower()]
+        assert _symbols(client.get("/stocks", params={"search": "S1"})) == expected
+    
+    def test_top_n(self, client, uploaded):
+        """top_n keeps the best-ranked stocks, combined with other filters."""
+        assert _symbols(client.get("/stocks", params={"top_n": 5})) == [s.data.symbol for s in uploaded[:5]]
+        expected = [s.data.symbol for s in uploaded[:10] if s.data.industry == "Software"]
+        assert _symbols(client.get("/stocks", params={"top_n": 10, "industry": "Software"})) == expected
+    
+    def test_sort_by_price(self, client, uploaded):
+        """A non-rank sort orders the whole table and filtered subsets."""
+        by_price = sorted(uploaded, key=lambda s: s.data.price, reverse=True)
+        response = client.get("/stocks", params={"sort_by": "price", "sort_dir": "desc"})
+        assert _symbols(response) == [s.data.symbol for s in by_price]
+        
+        response = client.get("/stocks", params={"sort_by": "price", "sort_dir": "desc", "sector": "Health Care"})
+        assert _symbols(response) == [s.data.symbol for s in by_price if s.data.sector == "Health Care"]
+    
+    def test_sorting_leaves_snapshot_untouched(self, client, uploaded):
+        """Sorted views and filtered sorts never reorder the shared rank-ordered stocks."""
+        client.get("/stocks", params={"sort_by": "symbol", "sort_dir": "desc"})
+        client.get("/stocks", params={"sort_by": "score", "industry": "Software"})
+        client.get("/stocks", params={"sort_by": "price", "top_n": 10})
+        
+        snap = routes._snapshot
+        assert [s.rank for s in snap.stocks] == list(range(1, len(uploaded) + 1))
+        assert all(positions == sorted(positions) for positions in snap.by_industry.values())
+        assert _symbols(client.get("/stocks")) == [s.data.symbol for s in uploaded]
+
+
+class TestUploadCsv:
+    """Test upload validation."""
+    
+    @pytest.fixture
+    def max_size(self, monkeypatch):
+        """Lower the upload limit to 1 MB and return it in bytes."""
+        settings = routes.get_settings().model_copy(update={"max_file_size_mb": 1})
+        monkeypatch.setattr(routes, "get_settings", lambda: settings)
+        return 1024 * 1024
+    
+    def _padded_csv(self, stock, size: int) -> bytes:
+        """A one-stock CSV padded through its description to exactly size bytes."""
+        base = _to_csv([replace(stock, description="")])
+        return _to_csv([replace(stock, description="x" * (size - len(base)))])
+    
+    def test_upload_at_limit_is_accepted(self, client, random_stocks, max_size):
+        """A file of exactly the limit is read in full and processed."""
+        content = self._padded_csv(random_stocks(1, seed=1)[0], max_size)
+        assert len(content) == max_size
+        
+        response = client.post("/upload", files={"file": ("stocks.csv", content, "text/csv")})
+        assert response.status_code == 200
+        assert [s.data.symbol for s in routes._snapshot.stocks] == ["S00"]
+    
+    def test_upload_one_byte_over_limit_is_rejected(self, client, random_stocks, max_size):
+        """A file one byte over the limit gets a 400 and leaves the snapshot alone."""
+        before = routes._snapshot
+        content = self._padded_csv(random_stocks(1, seed=1)[0], max_size + 1)
+        assert len(content) == max_size + 1
+        
+        response = client.post("/upload", files={"file": ("stocks.csv", content, "text/csv")})
+        assert response.status_code == 400
+        assert "File too large" in response.text
+        assert routes._snapshot is before
+
@@ -1,12 +1,19 @@
 """Tests for scoring modules."""
 import pytest
+from dataclasses import astuple, replace
 from app.core.price_momentum import calculate_price_momentum
 from app.core.volume_momentum import calculate_volume_momentum
 from app.core.technical import calculate_technical_strength
 from app.core.breakout import calculate_breakout_score
 from app.core.stability import calculate_stability_score
-from app.core.scoring import calculate_total_score, calculate_components
+from app.core.scoring import (
+    calculate_total_score, calculate_components, calculate_components_bulk, score_stock_arrays,
+)
+from app.core.arrays import build_stock_arrays
+from app.core._scoring_numba import HAS_NUMBA, calculate_components_numba, calculate_confidence_numba
+from app.core.constants import get_scoring_constants
 from app.models import StockData, ScoreComponents
+from app.services.confidence import calculate_confidence, _calculate_confidence_numpy
 
 
 @pytest.fixture
@@ -24,13 +31,16 @@ def sample_stock():
         volume_1w=80000000,
         avg_volume_90d=65000000,
         earnings_date=None,
+        change_1d=0.8,
         perf_1w=2.5,
         perf_1m=8.3,
         perf_3m=15.2,
         perf_6m=25.0,
+        perf_ytd=20.0,
         perf_1y=35.0,
         volatility_1m=2.5,
         high_52w=195.00,
+        high_all_time=199.60,
         sma_50=180.25,
         sma_200=165.50,
         rel_volume=1.5,
@@ -39,6 +49,40 @@ def sample_stock():
     )
 
 
+@pytest.fixture(scope="module")
+def sample_stocks(random_stocks):
+    """64 randomized stocks spanning the score tiers, including missing data, plus tier-edge stocks."""
+    stocks = random_stocks(64, seed=42)
+    return stocks + _boundary_stocks(stocks[0])
+
+
+def _boundary_stocks(base):
+    """Stocks sitting exactly on the proximity, relative volume, beta and market cap tier edges."""
+    edges = [
+        replace(base, price=pct, high_52w=100.0, high_all_time=100.0, rel_volume=rel_vol)
+        for pct in (95.0, 90.0, 85.0, 80.0, 70.0, 50.0, 30.0)
+        for rel_vol in (1.2, 1.5)
+    ]
+    edges += [
+        replace(base, price=512.24, high_52w=539.2, high_all_time=539.2),
+        replace(base, price=512.24, high_52w=512.24, high_all_time=512.24),
+    ]
+    edges += [replace(base, beta=beta) for beta in (0.5, 1.0, 1.5, 2.0, 2.5)]
+    edges += [replace(base, market_cap=billions * 1e9) for billions in (2.0, 10.0, 20.0, 50.0, 100.0)]
+    # Zero-data and low-tier branches
+    edges.append(replace(
+        base, price=40.0, high_52w=0.0, high_all_time=120.0, sma_50=45.0, sma_200=0.0, avg_volume_90d=0.0,
+        rel_volume=0.8, market_cap=1_500_000_000, beta=3.1, volatility_1m=9.0, perf_6m=-12.0,
+    ))
+    return [replace(stock, symbol=f"E{i:02d}") for i, stock in enumerate(edges)]
+
+
+@pytest.fixture(scope="module")
+def sample_frame(sample_stocks):
+    """Columnar view of sample_stocks."""
+    return build_stock_arrays(sample_stocks)
+
+
 class TestPriceMomentum:
     """Test price momentum calculations."""
     
@@ -47,6 +91,15 @@ class TestPriceMomentum:
         score = calculate_price_momentum(sample_stock)
         assert isinstance(score, float)
         assert score > 0  # Positive performance should give positive score
+    
+    def test_price_momentum_uses_given_constants(self, sample_stock):
+        """Explicit scoring constants override the configured weights."""
+        constants = replace(
+            get_scoring_constants(),
+            price_weight_6m=1.0, price_weight_3m=0.0, price_weight_1m=0.0,
+            price_weight_1y=0.0, price_weight_1w=0.0,
+        )
+        assert calculate_price_momentum(sample_stock, constants) == sample_stock.perf_6m
 
 
 class TestVolumeMomentum:
@@ -113,4 +166,35 @@ class TestTotalScore:
         )
         total = calculate_total_score(components)
         assert isinstance(total, float)
-        assert total > 0
\ No newline at end of file
+        assert total > 0
+
+
+class TestBulkScoring:
+    """Test vectorized scoring matches the per-stock functions."""
+    
+    @pytest.mark.parametrize("confidence_fn", [
+        _calculate_confidence_numpy,
+        pytest.param(calculate_confidence_numba, marks=pytest.mark.skipif(not HAS_NUMBA, reason="numba not installed")),
+    ])
+    def test_confidence_bulk_matches_scalar(self, sample_stocks, sample_frame, confidence_fn):
+        """Bulk confidence should equal calculate_confidence with components."""
+        components, _ = calculate_components_bulk(sample_frame, get_scoring_constants())
+        confidence = confidence_fn(sample_frame, components)
+        
+        for stock, value in zip(sample_stocks, confidence):
+            assert value == pytest.approx(calculate_confidence(stock, calculate_components(stock)))
+    
+    @pytest.mark.parametrize("scorer", [
+        score_stock_arrays,
+        calculate_components_bulk,
+        pytest.param(calculate_components_numba, marks=pytest.mark.skipif(not HAS_NUMBA, reason="numba not installed")),
+    ])
+    def test_score_stock_arrays_matches_scalar(self, sample_stocks, sample_frame, scorer):
+        """Batch totals over the random and tier-edge universe should equal the scalar path stock by stock."""
+        components, totals = scorer(sample_frame, get_scoring_constants())
+        
+        assert totals.shape == (len(sample_stocks),)
+        for stock, row, total in zip(sample_stocks, components, totals):
+            expected = calculate_components(stock)
+            assert tuple(row) == pytest.approx(astuple(expected))
+            assert total == pytest.approx(calculate_total_score(expected))